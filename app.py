@@ -72,6 +72,8 @@ else:
 jobs = {}
 # Store running job threads to allow termination
 job_threads = {}
+# Cancellation events for jobs running in this process, set by the cancel endpoint
+job_cancel_events = {}
 # Add a lock for job status updates to prevent race conditions
 job_status_lock = threading.Lock()
 
@@ -236,6 +238,10 @@ def load_job_status_from_file(job_id):
 def run_job(job_id, locations, property_types, min_floor_area, max_floor_area, 
             business_type, headless, download_dir, output_dir):
     """Run the main processing job with robust race condition protection and file verification"""
+    # The cancel endpoint sets this event and the scraper checks it directly; is_cancelled()
+    # below also sets it when it finds a cancellation saved by another worker process
+    with job_status_lock:
+        cancel_event = job_cancel_events.setdefault(job_id, threading.Event())
     try:
         # Define clear progress milestones
         PROGRESS_MILESTONES = {
@@ -257,11 +263,14 @@ def run_job(job_id, locations, property_types, min_floor_area, max_floor_area,
         # Enhanced cancellation check with more robust detection
         def is_cancelled():
             """Enhanced cancellation check with multiple strategies for Azure."""
+            if cancel_event.is_set():
+                return True
             try:
                 # Strategy 1: Check in-memory cache first (fastest)
                 with job_status_lock:
                     if job_id in jobs and jobs[job_id].get('cancelled', False):
                         logger.info(f"Cancellation detected in memory for job {job_id}")
+                        cancel_event.set()
                         return True
                 
                 # Strategy 2: Check file with retry logic
@@ -273,6 +282,7 @@ def run_job(job_id, locations, property_types, min_floor_area, max_floor_area,
                     
                     if job_status.get('cancelled', False):
                         logger.info(f"Cancellation detected in file for job {job_id}")
+                        cancel_event.set()
                         return True
                 
                 return False
@@ -350,13 +360,14 @@ def run_job(job_id, locations, property_types, min_floor_area, max_floor_area,
             progress_callback=progress_callback,
             is_cancelled=is_cancelled,
             download_dir=download_dir,
-            output_dir=output_dir
+            output_dir=output_dir,
+            cancel_event=cancel_event
         )
 
-        # Check cancellation after processing
+        # Check cancellation after processing - exports that finished before the cancel are kept
         if is_cancelled():
             logger.info(f"Job {job_id} was cancelled during processing")
-            cleanup_job_files(job_id)
+            cleanup_job_files(job_id, keep_downloads=result == 'Cancelled with partial downloads')
             return
 
         if result == 'No files downloaded':
@@ -368,11 +379,12 @@ def run_job(job_id, locations, property_types, min_floor_area, max_floor_area,
             # Progress update for verification start
             progress_callback(PROGRESS_MILESTONES['merge_complete'], "Processing complete. Verifying output files...")
             
-            files = os.listdir(result)
+            # Find the newest output file in one directory pass
+            with os.scandir(result) as it:
+                files = [entry for entry in it if entry.is_file()]
             if files:
-                files.sort(key=lambda x: os.path.getmtime(os.path.join(result, x)), reverse=True)
-                result_file = os.path.join(result, files[0])
-                result_file = os.path.abspath(result_file)
+                newest = max(files, key=lambda entry: entry.stat().st_mtime)
+                result_file = os.path.abspath(newest.path)
                 
                 progress_callback(PROGRESS_MILESTONES['file_verification'], "Verifying file integrity and accessibility...")
                 
@@ -484,6 +496,8 @@ def run_job(job_id, locations, property_types, min_floor_area, max_floor_area,
     finally:
         if job_id in job_threads:
             del job_threads[job_id]
+        with job_status_lock:
+            job_cancel_events.pop(job_id, None)
 
 
 def check_if_cancelled(job_id):
@@ -574,8 +588,12 @@ def update_job_status(job_id, status, progress, message, result_file=None):
         logger.error(traceback.format_exc())
 
 
-def cleanup_job_files(job_id):
-    """Clean up job-specific directories after successful download"""
+def cleanup_job_files(job_id, keep_downloads=False):
+    """
+    Clean up job-specific directories after successful download.
+
+    keep_downloads leaves the download directory in place, for a cancelled job's finished exports.
+    """
     # Don't cleanup immediately - allow time for download
     def delayed_cleanup():
         time.sleep(30)  # Wait 30 seconds for download to complete
@@ -599,7 +617,9 @@ def cleanup_job_files(job_id):
             merged_dir = current_job.get('merged_dir')
             
             # Clean up download directory
-            if download_dir and os.path.exists(download_dir):
+            if keep_downloads:
+                logger.info(f"Keeping finished exports for cancelled job {job_id} in {download_dir}")
+            elif download_dir and os.path.exists(download_dir):
                 try:
                     shutil.rmtree(download_dir)
                     logger.info(f"Removed download directory for job {job_id}")
@@ -629,6 +649,7 @@ def cleanup_job_files(job_id):
             with job_status_lock:
                 if job_id in jobs:
                     del jobs[job_id]
+                job_cancel_events.pop(job_id, None)
                 
         except Exception as e:
             logger.error(f"Error cleaning up job {job_id}: {str(e)}")
@@ -851,6 +872,9 @@ def cancel_job():
             
             # Update all cancellation-related fields
             jobs[job_id]['cancelled'] = True
+            # Signal the running scraper directly; registered here too so a job that hasn't
+            # started yet sees the cancellation as soon as it does
+            job_cancel_events.setdefault(job_id, threading.Event()).set()
             jobs[job_id]['status'] = 'cancelled'
             jobs[job_id]['message'] = 'Job cancelled by user'
             jobs[job_id]['last_updated'] = time.time()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# Direct HTTP client for RP Data exports, bypassing the browser
+#
+# The RP Data SPA drives its searches and exports through JSON endpoints. Those
+# endpoints aren't documented, so they are discovered once by recording the
+# XHR/fetch traffic of a normal Selenium run (RPDATA_CAPTURE_API=1) and then
+# mapped into an endpoints file that RPDataAPI reads. The browser flow stays
+# the default and the fallback; the API path only runs with RPDATA_USE_API=1.
+
+import os
+import json
+import time
+import logging
+import requests
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Where captured traffic is written and where the endpoint mapping is read from
+ENDPOINTS_FILE = os.environ.get(
+    'RPDATA_API_ENDPOINTS',
+    os.path.join(os.path.expanduser("~"), ".rpdata_api_endpoints.json")
+)
+CAPTURE_FILE = os.path.join(os.path.expanduser("~"), ".rpdata_api_capture.json")
+
+# sessionStorage key the captured requests are kept under
+CAPTURE_KEY = '__rpdataRequests'
+
+# Records every fetch/XHR the page makes into sessionStorage so it survives SPA route changes.
+# Bodies of auth requests are never recorded, so credentials can't end up in the capture file.
+CAPTURE_JS = """
+(function() {
+    if (window.__rpdataCapture) return;
+    window.__rpdataCapture = true;
+    function record(entry) {
+        try {
+            if (/login|logon|auth|token|password/i.test(entry.url)) entry.body = null;
+            var log = JSON.parse(sessionStorage.getItem(%(key)s) || '[]');
+            log.push(entry);
+            sessionStorage.setItem(%(key)s, JSON.stringify(log));
+        } catch (e) {}
+    }
+    var origFetch = window.fetch;
+    window.fetch = function(input, init) {
+        var url = typeof input === 'string' ? input : input.url;
+        var method = (init && init.method) || (input && input.method) || 'GET';
+        var body = init && typeof init.body === 'string' ? init.body.slice(0, 2000) : null;
+        return origFetch.apply(this, arguments).then(function(resp) {
+            record({kind: 'fetch', method: method, url: url, status: resp.status,
+                    contentType: resp.headers.get('content-type'), body: body});
+            return resp;
+        });
+    };
+    var origOpen = XMLHttpRequest.prototype.open;
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function(method, url) {
+        this.__rpdata = {kind: 'xhr', method: method, url: url};
+        return origOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function(body) {
+        var xhr = this;
+        if (xhr.__rpdata) {
+            xhr.__rpdata.body = typeof body === 'string' ? body.slice(0, 2000) : null;
+            xhr.addEventListener('loadend', function() {
+                xhr.__rpdata.status = xhr.status;
+                xhr.__rpdata.contentType = xhr.getResponseHeader('content-type');
+                record(xhr.__rpdata);
+            });
+        }
+        return origSend.apply(this, arguments);
+    };
+})();
+""" % {'key': json.dumps(CAPTURE_KEY)}
+
+
+def enable_capture(driver):
+    """Start recording the page's XHR/fetch traffic on this driver. Call it only once logged in."""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": CAPTURE_JS})
+        driver.execute_script(CAPTURE_JS)
+        logger.info("API traffic capture enabled")
+    except Exception as e:
+        logger.warning(f"Could not enable API traffic capture: {e}")
+
+
+def save_capture(driver, path=CAPTURE_FILE):
+    """
+    Write the recorded traffic to a JSON file for endpoint discovery.
+
+    Returns:
+        int: Number of requests written
+    """
+    try:
+        captured = driver.execute_script("return sessionStorage.getItem(arguments[0]);", CAPTURE_KEY)
+        captured = json.loads(captured) if captured else []
+        with open(path, "w") as f:
+            json.dump(captured, f, indent=2)
+        logger.info(f"Saved {len(captured)} captured requests to {path}")
+        return len(captured)
+    except Exception as e:
+        logger.warning(f"Could not save captured API traffic: {e}")
+        return 0
+
+
+class RPDataAPI:
+    """
+    Runs RP Data searches and exports over HTTP using a discovered endpoint map.
+
+    The endpoints file is a JSON object with "login", "search" and "export"
+    entries, each holding at least a "url" (and optionally "method"). Fields
+    the client fills in are configurable so the mapping can follow whatever
+    the captured traffic shows:
+
+        login:  username_field, password_field
+        search: id_field (key of the search id in the JSON response)
+        export: url may contain {search_id}; extension defaults to ".xlsx"
+    """
+
+    REQUIRED_ENDPOINTS = ("login", "search", "export")
+
+    def __init__(self, endpoints):
+        self.endpoints = endpoints
+        # No response cache: login, search and export all need a live answer, and an export
+        # mapped as a GET would otherwise be served stale
+        self.session = requests.Session()
+        self.session.headers.update(endpoints.get("headers", {}))
+
+    @classmethod
+    def from_config(cls, path=ENDPOINTS_FILE):
+        """Load the endpoint map, returning None if it's missing or incomplete."""
+        try:
+            with open(path) as f:
+                endpoints = json.load(f)
+        except (OSError, ValueError):
+            logger.info(f"No RP Data API endpoint map at {path}")
+            return None
+
+        missing = [name for name in cls.REQUIRED_ENDPOINTS if not endpoints.get(name, {}).get("url")]
+        if missing:
+            logger.warning(f"RP Data API endpoint map is missing: {missing}")
+            return None
+        return cls(endpoints)
+
+    def _request(self, name, timeout=60, **kwargs):
+        endpoint = self.endpoints[name]
+        url = endpoint["url"].format(**kwargs.pop("url_args", {}))
+        response = self.session.request(endpoint.get("method", "POST"), url, timeout=timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def login(self, username, password):
+        """Authenticate the session. Returns True on success."""
+        endpoint = self.endpoints["login"]
+        try:
+            self._request("login", json={
+                endpoint.get("username_field", "username"): username,
+                endpoint.get("password_field", "password"): password
+            })
+            logger.info("Logged in to RP Data API")
+            return True
+        except Exception as e:
+            logger.error(f"RP Data API login failed: {e}")
+            return False
+
+    def search(self, search_type, locations, filters):
+        """
+        Run a search and return its id, or None on failure.
+
+        Args:
+            search_type (str): "For Rent", "For Sale" or "Sales"
+            locations (list): Locations to search
+            filters (dict): Property types and floor area range
+        """
+        try:
+            response = self._request("search", json={
+                "searchType": search_type,
+                "locations": locations,
+                **filters
+            })
+            search_id = response.json().get(self.endpoints["search"].get("id_field", "id"))
+            logger.info(f"RP Data API search for {search_type} returned id {search_id}")
+            return search_id
+        except Exception as e:
+            logger.error(f"RP Data API search failed for {search_type}: {e}")
+            return None
+
+    def export_csv(self, search_id):
+        """Download the export for a search. Returns the file bytes, or None on failure."""
+        try:
+            return self._request("export", timeout=120, url_args={"search_id": search_id}).content
+        except Exception as e:
+            logger.error(f"RP Data API export failed for search {search_id}: {e}")
+            return None
+
+    def export_all(self, search_types, prefix_map, locations, property_types, min_floor_area, max_floor_area,
+                   download_dir):
+        """
+        Export every search type into download_dir using the browser's file names.
+
+        Args:
+            search_types (iterable): Search types to export, in order
+            prefix_map (mapping): Search type -> export filename prefix
+
+        Returns:
+            dict: Search type -> downloaded file path (only successful exports)
+        """
+        extension = self.endpoints["export"].get("extension", ".xlsx")
+        filters = {
+            "propertyTypes": property_types,
+            "minFloorArea": min_floor_area,
+            "maxFloorArea": max_floor_area
+        }
+
+        result_files = {}
+        for search_type in search_types:
+            search_id = self.search(search_type, locations, filters)
+            if search_id is None:
+                continue
+            content = self.export_csv(search_id)
+            if not content:
+                continue
+            file_path = os.path.join(
+                download_dir, f"{prefix_map[search_type]}_{time.strftime('%Y%m%d%H%M%S')}{extension}"
+            )
+            with open(file_path, "wb") as f:
+                f.write(content)
+            result_files[search_type] = file_path
+            logger.info(f"Added API export for {search_type}: {os.path.basename(file_path)}")
+        return result_files
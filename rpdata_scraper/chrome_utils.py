@@ -4,6 +4,8 @@
 import os
 import sys
 import time
+import atexit
+import threading
 import random
 import logging
 import platform
@@ -14,6 +16,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+# Add this directory to the path if it isn't already there
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+from driver_cache import get_driver_path
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,7 +29,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def setup_chrome_driver(headless=True, download_dir=None):
+# Connections kept open to chromedriver per driver, so concurrent commands aren't serialized
+HTTP_POOL_SIZE = int(os.environ.get('RPDATA_HTTP_POOL_SIZE', '10'))
+
+# Open every session against one long-lived chromedriver instead of spawning one per driver
+SHARE_CHROMEDRIVER = os.environ.get('RPDATA_SHARED_CHROMEDRIVER') == '1'
+_shared_service = None
+_shared_service_lock = threading.Lock()
+
+
+class SharedChrome(webdriver.Remote):
+    """
+    A Chrome session over a connection built by _connect(), with the CDP helper webdriver.Chrome has.
+
+    Sessions on the shared chromedriver leave service unset; a session with its own
+    chromedriver is given it, and stops it on quit() as webdriver.Chrome does.
+    """
+
+    def __init__(self, command_executor, options, service=None):
+        super().__init__(command_executor=command_executor, options=options)
+        if service is not None:
+            self.service = service
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        # Unlike webdriver.Chrome, a failed quit() is raised so the pool can clean up the browser
+        try:
+            super().quit()
+        finally:
+            service = getattr(self, 'service', None)
+            if service is not None:
+                service.stop()
+
+
+def _connect(server_url):
+    """
+    Build the connection to a chromedriver with a connection pool of HTTP_POOL_SIZE.
+
+    Goes through ClientConfig so Selenium still applies its proxy, certificate
+    and per-request timeout handling to the pool manager it creates.
+    """
+    from selenium.webdriver.remote.client_config import ClientConfig
+    from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+    client_config = ClientConfig(
+        remote_server_addr=server_url,
+        keep_alive=True,
+        timeout=120,
+        # RemoteConnection reads the pool manager kwargs from this nested key
+        init_args_for_pool_manager={"init_args_for_pool_manager": {"maxsize": HTTP_POOL_SIZE}}
+    )
+    return ChromiumRemoteConnection(server_url, vendor_prefix="goog", browser_name="chrome",
+                                    client_config=client_config)
+
+
+def _start_shared_service(service):
+    """Start the process-wide chromedriver on first use (or after it died) and return it."""
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None or not _shared_service.is_connectable():
+            service.start()
+            atexit.register(service.stop)
+            _shared_service = service
+            logger.info(f"Started shared chromedriver at {service.service_url}")
+        return _shared_service
+
+
+def _create_shared_driver(service, options):
+    """Open a new Chrome session on the shared chromedriver."""
+    shared = _start_shared_service(service)
+    return SharedChrome(command_executor=_connect(shared.service_url), options=options)
+
+
+def _create_owned_driver(service, options):
+    """Start a chromedriver for this driver alone and open a Chrome session on it."""
+    service.start()
+    try:
+        return SharedChrome(command_executor=_connect(service.service_url), options=options, service=service)
+    except Exception:
+        service.stop()
+        raise
+
+# "eager" returns once the DOM is ready instead of waiting for every subresource; "normal" restores the default.
+# "none" isn't the default: session restore writes sessionStorage straight after get(), which needs the new document.
+PAGE_LOAD_STRATEGIES = ('normal', 'eager', 'none')
+PAGE_LOAD_STRATEGY = os.environ.get('RPDATA_PAGE_LOAD_STRATEGY', 'eager')
+if PAGE_LOAD_STRATEGY not in PAGE_LOAD_STRATEGIES:
+    # Options rejects anything else, which would fail every driver launch
+    logger.warning(f"Unknown RPDATA_PAGE_LOAD_STRATEGY {PAGE_LOAD_STRATEGY!r}, using 'eager'")
+    PAGE_LOAD_STRATEGY = 'eager'
+
+def setup_chrome_driver(headless=True, download_dir=None, user_data_dir=None):
     try:
         logger.info("Setting up Chrome driver for cloud/Docker environment...")
 
@@ -39,6 +138,9 @@ def setup_chrome_driver(headless=True, download_dir=None):
 
         options = Options()
         
+        # Return from navigations at DOMContentLoaded; the scraper waits explicitly for what it needs
+        options.page_load_strategy = PAGE_LOAD_STRATEGY
+        
         # Critical core stability flags for all environments
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
@@ -58,6 +160,10 @@ def setup_chrome_driver(headless=True, download_dir=None):
         options.add_argument("--disable-backgrounding-occluded-windows")
         options.add_argument("--disable-client-side-phishing-detection")
         options.add_argument("--disable-popup-blocking")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        
+        # Chrome only honours the last --disable-features flag, so collect them and add one at the end
+        disabled_features = []
         
         # User agent and window settings
         options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36")
@@ -72,6 +178,10 @@ def setup_chrome_driver(headless=True, download_dir=None):
             "plugins.always_open_pdf_externally": True,
             # Performance preferences
             "profile.default_content_setting_values.images": 2,  # Don't load images for better performance
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.plugins": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            # Stylesheets stay enabled - visibility checks (is_displayed, getClientRects) depend on CSS
             "profile.default_content_setting_values.cookies": 1,  # Accept cookies
             "profile.managed_default_content_settings.javascript": 1,  # Enable JavaScript
             # Network timeouts
@@ -81,7 +191,6 @@ def setup_chrome_driver(headless=True, download_dir=None):
         # Special configuration for Azure
         if is_azure:
             logger.info("Using Azure-specific Chrome configuration")
-            options.page_load_strategy = 'eager'
             
             # Critical for Azure stability
             options.add_argument("--disable-gpu-sandbox")
@@ -92,7 +201,7 @@ def setup_chrome_driver(headless=True, download_dir=None):
             options.add_argument("--disable-crash-reporter")
             
             # Network and loading optimizations for Azure
-            options.add_argument("--disable-features=NetworkService,NetworkServiceInProcess")
+            disabled_features += ["NetworkService", "NetworkServiceInProcess"]
             options.add_argument("--disk-cache-size=33554432")  # 32MB disk cache
             options.add_argument("--media-cache-size=33554432")  # 32MB media cache
 
@@ -115,7 +224,17 @@ def setup_chrome_driver(headless=True, download_dir=None):
                 # Additional flags for stability on ARM64 emulation (Mac M2)
                 if is_macos:
                     options.add_argument("--single-process")  # More stable for emulation
-                    options.add_argument("--incognito")  # Prevents profile issues
+                    if not user_data_dir:
+                        options.add_argument("--incognito")  # Prevents profile issues
+        
+        if disabled_features:
+            options.add_argument(f"--disable-features={','.join(disabled_features)}")
+        
+        # Persistent profile so HTTP cache and session cookies survive between runs
+        if user_data_dir:
+            os.makedirs(user_data_dir, exist_ok=True)
+            options.add_argument(f"--user-data-dir={user_data_dir}")
+            options.add_argument("--profile-directory=Default")
         
         # Apply download directory settings if provided
         if download_dir:
@@ -138,14 +257,26 @@ def setup_chrome_driver(headless=True, download_dir=None):
             logger.info(f"  {arg}")
 
         # Configure service with appropriate path
-        service = Service(executable_path="/usr/bin/chromedriver") if is_container else None
+        if is_container:
+            service = Service(executable_path="/usr/bin/chromedriver")
+        else:
+            # Reuse the chromedriver cached for this Chrome version instead of resolving it on every launch
+            driver_path, _ = get_driver_path()
+            service = Service(executable_path=driver_path) if driver_path else None
         
         # Set service arguments for logging
         if is_container and service:
             service.service_args = ['--log-level=INFO']
         
-        # Create Chrome driver
-        driver = webdriver.Chrome(service=service, options=options)
+        # Create Chrome driver over a widened connection pool (Selenium's default holds a single
+        # connection). Both paths need a known chromedriver binary to start it themselves;
+        # without one, webdriver.Chrome resolves it and keeps the default pool.
+        if SHARE_CHROMEDRIVER and service:
+            driver = _create_shared_driver(service, options)
+        elif service:
+            driver = _create_owned_driver(service, options)
+        else:
+            driver = webdriver.Chrome(service=service, options=options)
         
         # Set window size in a try-except block for stability
         try:
@@ -162,13 +293,7 @@ def setup_chrome_driver(headless=True, download_dir=None):
 
         # Configure download behavior in headless mode
         if headless and download_dir:
-            try:
-                driver.execute_cdp_cmd('Page.setDownloadBehavior', {
-                    'behavior': 'allow',
-                    'downloadPath': download_dir
-                })
-            except Exception as e:
-                logger.warning(f"CDP download behavior setup failed: {e}")
+            set_download_dir(driver, download_dir)
 
         logger.info("Chrome WebDriver initialized successfully")
         return driver
@@ -182,6 +307,29 @@ def setup_chrome_driver(headless=True, download_dir=None):
         return None
 
 
+def set_download_dir(driver, download_dir):
+    """
+    Point the browser's downloads at download_dir.
+
+    Browser.setDownloadBehavior applies to every tab and window, so an export
+    that opens in a new target still lands in the job's directory; the
+    deprecated Page.setDownloadBehavior is the fallback for older Chrome.
+
+    Returns:
+        bool: True if either command succeeded
+    """
+    download_path = os.path.abspath(download_dir)
+    error = None
+    for command in ('Browser.setDownloadBehavior', 'Page.setDownloadBehavior'):
+        try:
+            driver.execute_cdp_cmd(command, {'behavior': 'allow', 'downloadPath': download_path})
+            return True
+        except Exception as e:
+            error = e
+    logger.warning(f"CDP download behavior setup failed: {error}")
+    return False
+
+
 def random_wait(min_seconds=0.5, max_seconds=2):
     wait_time = min_seconds + random.random() * (max_seconds - min_seconds)
     time.sleep(wait_time)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Caches the chromedriver binary per installed Chrome version
+
+import os
+import re
+import json
+import shutil
+import logging
+import platform
+import threading
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.path.expanduser("~")) / ".rpdata_cache" / "driver"
+
+CHROME_CANDIDATES = [
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+]
+
+# First dotted version in `--version` output; Debian's Chromium appends "built on Debian 12.4"
+VERSION_RE = re.compile(r"\b(\d+(?:\.\d+){2,3})\b")
+
+# Resolved (driver path, major version) per Chrome binary for this process
+_resolved = {}
+# Held while resolving, so concurrent workers don't copy the same driver over each other
+_resolve_lock = threading.Lock()
+
+
+def find_chrome_binary():
+    """Return the path of the installed Chrome/Chromium binary, or None."""
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if path:
+            return path
+    return None
+
+
+def _resolve_with_selenium_manager(major_version):
+    """Ask Selenium Manager for a chromedriver matching the Chrome major version."""
+    from selenium.webdriver.common.selenium_manager import SeleniumManager
+    paths = SeleniumManager().binary_paths(["--browser", "chrome", "--browser-version", str(major_version)])
+    return paths.get("driver_path")
+
+
+def get_driver_path(chrome_binary=None):
+    """
+    Return a chromedriver matching the installed Chrome, resolving it once per version.
+
+    The first run for a Chrome version resolves the driver with Selenium
+    Manager and copies it to ~/.rpdata_cache/driver/<version>/; later runs use
+    the cached binary without probing or downloading anything.
+
+    Returns:
+        Tuple of (chromedriver path, Chrome major version), or (None, None)
+        if Chrome can't be found, in which case Selenium resolves the driver
+    """
+    chrome_binary = chrome_binary or find_chrome_binary()
+    if not chrome_binary:
+        return None, None
+    with _resolve_lock:
+        if chrome_binary not in _resolved:
+            resolved = _resolve_driver(chrome_binary)
+            if resolved == (None, None):
+                return resolved
+            _resolved[chrome_binary] = resolved
+        return _resolved[chrome_binary]
+
+
+def _resolve_driver(chrome_binary):
+    """Find or cache the chromedriver for chrome_binary. Call with _resolve_lock held."""
+    try:
+        output = subprocess.check_output([chrome_binary, "--version"], timeout=10).decode()
+        version = VERSION_RE.search(output).group(1)
+        major_version = int(version.split(".")[0])
+    except Exception as e:
+        logger.warning(f"Could not read Chrome version from {chrome_binary}: {e}")
+        return None, None
+
+    driver_name = "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+    cached_driver = CACHE_DIR / version / driver_name
+    meta_file = CACHE_DIR / version / "driver.json"
+
+    if not cached_driver.exists():
+        try:
+            driver_path = _resolve_with_selenium_manager(major_version)
+            if not driver_path:
+                return None, None
+            cached_driver.parent.mkdir(parents=True, exist_ok=True)
+            # Copy under a temporary name and rename into place, so another process never
+            # runs a half-written driver
+            fd, tmp_path = tempfile.mkstemp(dir=cached_driver.parent, prefix=f".{driver_name}-")
+            os.close(fd)
+            try:
+                shutil.copy2(driver_path, tmp_path)
+                os.chmod(tmp_path, 0o755)
+                os.replace(tmp_path, cached_driver)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+            with open(meta_file, "w") as f:
+                json.dump({"chrome": chrome_binary, "version": version, "source": driver_path}, f)
+            logger.info(f"Cached chromedriver for Chrome {version} at {cached_driver}")
+        except Exception as e:
+            logger.warning(f"Could not cache chromedriver, letting Selenium resolve it: {e}")
+            return None, None
+
+    return str(cached_driver), major_version
@@ -14,7 +14,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Add the parent directory to the path if it isn't already there
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if package_dir not in sys.path:
+    sys.path.append(package_dir)
 from chrome_utils import setup_chrome_driver
 
 # Set up logging
@@ -4,7 +4,10 @@
 
 import os
 import sys
+import queue
+import atexit
 import logging
+import logging.handlers
 import time
 import traceback
 import threading
@@ -28,6 +31,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def queue_root_logging():
+    """
+    Hand the root logger's handlers to a background QueueListener.
+
+    Log calls from the scraper threads then only enqueue the record, and the
+    stream/file writes happen on the listener thread. Safe to call repeatedly.
+    """
+    root = logging.getLogger()
+    if not root.handlers or any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return
+    handlers = root.handlers[:]
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    # Flush whatever is still queued on shutdown
+    atexit.register(listener.stop)
+
+
+queue_root_logging()
+
 # Thread-local storage for progress synchronization
 _progress_state = threading.local()
 
@@ -39,9 +66,16 @@ def get_progress_state():
         _progress_state.lock = threading.Lock()
     return _progress_state
 
+def keep_partial_downloads(result_files):
+    """Result for a job cancelled after scraping: flag the finished exports to keep, if there are any."""
+    if not result_files:
+        return None
+    logger.info(f"Keeping exports finished before cancellation: {result_files}")
+    return 'Cancelled with partial downloads'
+
 def main(locations=None, property_types=None, min_floor_area="Min", max_floor_area="Max", 
          business_type=None, headless=False, progress_callback=None, is_cancelled=None,
-         download_dir=None, output_dir=None):
+         download_dir=None, output_dir=None, cancel_event=None):
     """
     Main function to scrape RP Data and process the results.
     
@@ -59,9 +93,12 @@ def main(locations=None, property_types=None, min_floor_area="Min", max_floor_ar
         is_cancelled (function): Function that returns True if job should be cancelled
         download_dir (str): Job-specific directory for downloads
         output_dir (str): Job-specific directory for output files
+        cancel_event (threading.Event): Set by the caller to cancel; checked without calling is_cancelled
     
     Returns:
-        str: Path to the merged Excel file, or None if the process failed
+        str: Path to the merged Excel file, or None if the process failed. A job
+            cancelled after some exports finished returns 'Cancelled with partial downloads'
+            and leaves those exports in download_dir
     """
     start_time = time.time()
     
@@ -188,7 +225,7 @@ def main(locations=None, property_types=None, min_floor_area="Min", max_floor_ar
             
             return safe_progress_callback(actual_percentage, message)
         
-        result_files, global_scraper = scrape_rpdata(
+        result_files, _, cancelled = scrape_rpdata(
             locations=locations,
             property_types=property_types,
             min_floor_area=min_floor_area,
@@ -196,18 +233,14 @@ def main(locations=None, property_types=None, min_floor_area="Min", max_floor_ar
             headless=headless,
             progress_callback=scraping_progress_callback,
             is_cancelled=is_cancelled,
-            download_dir=download_dir
+            download_dir=download_dir,
+            cancel_event=cancel_event
         )
         
         # Check cancellation after scraping
-        if is_cancelled() or safe_progress_callback(PROGRESS_MILESTONES['sales_complete'], "Scraping completed, preparing to merge files...") is False:
+        if cancelled or is_cancelled() or safe_progress_callback(PROGRESS_MILESTONES['sales_complete'], "Scraping completed, preparing to merge files...") is False:
             logger.info("Job cancelled after scraping")
-            if global_scraper:
-                try:
-                    global_scraper.close()
-                except Exception as e:
-                    logger.warning(f"Error closing scraper on cancellation: {e}")
-            return None
+            return keep_partial_downloads(result_files)
         
         if not result_files:
             logger.error("No files were downloaded during scraping")
@@ -215,14 +248,14 @@ def main(locations=None, property_types=None, min_floor_area="Min", max_floor_ar
         
         logger.info(f"Downloaded files: {result_files}")
 
-        # Wait for files to finalize
-        logger.info("Waiting for files to finalize...")
-        time.sleep(2)
+        # No settle delay needed. The download watcher reports a file on Chrome's .crdownload
+        # rename or on CLOSE_WRITE (never on create); its polling and timeout fallbacks wait
+        # for the size to stop changing. Cached exports were stored from such files.
         
         # Check cancellation before merging
         if is_cancelled() or safe_progress_callback(PROGRESS_MILESTONES['merge_start'], "Starting merge process...") is False:
             logger.info("Job cancelled before merging")
-            return None
+            return keep_partial_downloads(result_files)
         
         # Step 2: Process and merge the Excel files
         logger.info("\n===== STEP 2: PROCESSING AND MERGING FILES =====\n")
@@ -282,14 +315,6 @@ def main(locations=None, property_types=None, min_floor_area="Min", max_floor_ar
         logger.error(traceback.format_exc())
         safe_progress_callback(100, f"Error: {str(e)}")
         return None
-    finally:
-        # Ensure browser is closed
-        if 'global_scraper' in locals() and global_scraper:
-            try:
-                global_scraper.close()
-                logger.info("Closed global scraper instance")
-            except Exception as e:
-                logger.warning(f"Error closing global scraper: {e}")
 
 
 # Function to allow testing this module directly
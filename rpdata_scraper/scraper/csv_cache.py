@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# Disk cache for RP Data exports, keyed by the normalized search request
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".rpdata_cache")
+
+# Off unless RPDATA_CACHE=1 - a hit silently hands back an older RP Data export
+ENABLED = os.environ.get('RPDATA_CACHE') == '1'
+
+# How long a cached export stays valid once the cache is enabled, in seconds (default 6 hours)
+DEFAULT_TTL = int(os.environ.get('RPDATA_CACHE_TTL', str(6 * 60 * 60)))
+
+
+def cache_key(search_type, locations, property_types, min_floor_area, max_floor_area):
+    """
+    Build a stable key for a search request.
+
+    Locations and property types are sorted so the same search entered in a
+    different order still hits the cache.
+    """
+    request = {
+        "type": search_type,
+        "locs": sorted(locations or []),
+        "pt": sorted(property_types or []),
+        "min": min_floor_area,
+        "max": max_floor_area
+    }
+    return hashlib.blake2b(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+
+def _meta_path(key):
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(key, download_dir):
+    """
+    Copy a cached export into download_dir if a fresh one exists.
+
+    Args:
+        key (str): Key returned by cache_key()
+        download_dir (str): Directory to copy the cached export into
+
+    Returns:
+        str: Path of the copied file, or None on a cache miss or with the cache disabled
+    """
+    if not ENABLED:
+        return None
+    try:
+        with open(_meta_path(key)) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - meta.get("created", 0) > meta.get("ttl", DEFAULT_TTL):
+        logger.info(f"Cached export {key[:12]} has expired")
+        return None
+
+    cached_file = os.path.join(CACHE_DIR, key + os.path.splitext(meta["filename"])[1])
+    if not os.path.exists(cached_file):
+        return None
+
+    try:
+        os.makedirs(download_dir, exist_ok=True)
+        target = os.path.join(download_dir, meta["filename"])
+        shutil.copy(cached_file, target)
+        logger.info(f"Using cached export for {key[:12]}: {meta['filename']}")
+        return target
+    except Exception as e:
+        logger.warning(f"Could not copy cached export: {e}")
+        return None
+
+
+def put(key, file_path, ttl=None):
+    """
+    Store a freshly downloaded export in the cache.
+
+    Args:
+        key (str): Key returned by cache_key()
+        file_path (str): Path of the downloaded export
+        ttl (int): Seconds the entry stays valid, defaults to DEFAULT_TTL
+    """
+    if not ENABLED:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        filename = os.path.basename(file_path)
+        shutil.copy(file_path, os.path.join(CACHE_DIR, key + os.path.splitext(filename)[1]))
+        # Write the sidecar last so a half-copied export is never treated as a hit
+        with open(_meta_path(key), "w") as f:
+            json.dump({
+                "created": time.time(),
+                "ttl": ttl if ttl is not None else DEFAULT_TTL,
+                "filename": filename
+            }, f)
+    except Exception as e:
+        logger.warning(f"Could not cache export {file_path}: {e}")
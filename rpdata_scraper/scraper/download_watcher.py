@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# Watches a download directory and reports finished RP Data exports
+
+import os
+import time
+import queue
+import logging
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    # Without watchdog the watcher falls back to polling the directory
+    Observer = None
+    FileSystemEventHandler = object
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Chrome writes in-progress downloads under these suffixes and renames them when done
+PARTIAL_SUFFIXES = ('.crdownload', '.tmp')
+
+# How often the fallback poller rescans the directory when watchdog isn't installed, in seconds
+POLL_INTERVAL = 0.05
+
+# Gap between the two size checks that confirm a file found by scanning has stopped growing, in seconds
+STABLE_CHECK_INTERVAL = 0.25
+
+# A directory mtime this recent may hide a later change in the same timestamp tick on
+# coarse-grained filesystems, so it's rescanned even if unchanged, in nanoseconds
+MTIME_SETTLE_NS = 2 * 10**9
+
+
+def is_complete(path):
+    """Return True if path looks like a finished download rather than a temp file."""
+    name = os.path.basename(path)
+    return not name.startswith('.') and not name.endswith(PARTIAL_SUFFIXES)
+
+
+def is_stable(path, interval=STABLE_CHECK_INTERVAL):
+    """Return True if path is non-empty and its size is unchanged over interval seconds."""
+    try:
+        size = os.path.getsize(path)
+        time.sleep(interval)
+        return size > 0 and os.path.getsize(path) == size
+    except OSError:
+        return False
+
+
+def snapshot(dirpath, prefix):
+    """Return the names of finished files in dirpath that start with prefix."""
+    with os.scandir(dirpath) as it:
+        return {entry.name for entry in it if entry.name.startswith(prefix) and is_complete(entry.name)}
+
+
+def new_since(dirpath, prefix, before):
+    """
+    Return the path of the newest prefixed file that wasn't in the before snapshot.
+
+    Args:
+        dirpath (str): Directory to check
+        prefix (str): Export filename prefix
+        before (set): Names returned by snapshot() before the download started
+
+    Returns:
+        str: Path of the new file, or None if nothing new has appeared
+    """
+    # One pass over the directory; DirEntry carries the path and caches its stat
+    newest, newest_mtime = None, -1
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            if entry.name in before or not entry.name.startswith(prefix) or not is_complete(entry.name):
+                continue
+            mtime = entry.stat().st_mtime_ns
+            if mtime > newest_mtime:
+                newest, newest_mtime = entry.path, mtime
+    return newest
+
+
+class _DownloadHandler(FileSystemEventHandler):
+    """
+    Pushes completed download paths onto a queue, once each.
+
+    Only the .crdownload -> final name rename and CLOSE_WRITE count as
+    completion. A create event fires before any bytes are written, so it is
+    never reported.
+    """
+
+    def __init__(self, files):
+        super().__init__()
+        self.files = files
+        self._seen = set()
+
+    def _put(self, path):
+        if is_complete(path) and path not in self._seen:
+            self._seen.add(path)
+            self.files.put(path)
+
+    def on_moved(self, event):
+        # The .crdownload -> final name rename is when a download completes
+        if not event.is_directory:
+            self._put(event.dest_path)
+
+    def on_closed(self, event):
+        # inotify CLOSE_WRITE (Linux) - a file written in place is finished once it's closed
+        if not event.is_directory:
+            self._put(event.src_path)
+
+
+class DownloadWatcher:
+    """
+    Reports files as they finish downloading into a directory.
+
+    Uses a watchdog observer when available so a finished export is picked up
+    as soon as Chrome renames it or closes it after writing; otherwise polls
+    for files that weren't there when the watcher started and reports them
+    once their size has held steady for STABLE_CHECK_INTERVAL.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.files = queue.Queue()
+        # Finished downloads another prefix's wait picked up, by file name
+        self._unclaimed = {}
+        self._observer = None
+        # Directory mtime at the last poll's scan, so an unchanged directory costs one stat
+        self._scanned_mtime = None
+        # (size, time first seen at that size) of new files the poller is waiting on to settle
+        self._pending_sizes = {}
+        with os.scandir(directory) as it:
+            self._known = {entry.name for entry in it}
+        # Names already present or handed out, so the timeout fallback never returns them
+        self._claimed = set(self._known)
+
+        if Observer is not None:
+            try:
+                self._observer = Observer()
+                self._observer.schedule(_DownloadHandler(self.files), directory, recursive=False)
+                self._observer.daemon = True
+                self._observer.start()
+            except Exception as e:
+                logger.warning(f"Could not start download observer, polling instead: {e}")
+                self._observer = None
+
+    def _poll(self):
+        """
+        Queue files that have appeared since the last poll and stopped growing.
+
+        A scan can't tell a renamed, finished download from a file still being
+        written in place, so a new file is only reported once its size has been
+        non-zero and unchanged for STABLE_CHECK_INTERVAL.
+        """
+        # Creating or renaming an entry bumps the directory's mtime; skip the scan if it hasn't
+        # moved, unless a new file is still waiting for its size to settle (writes don't bump it)
+        mtime = os.stat(self.directory).st_mtime_ns
+        if (mtime == self._scanned_mtime and not self._pending_sizes
+                and time.time_ns() - mtime > MTIME_SETTLE_NS):
+            return
+        self._scanned_mtime = mtime
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name in self._known or not is_complete(entry.name):
+                    continue
+                try:
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                pending = self._pending_sizes.get(entry.name)
+                if pending is None or pending[0] != size:
+                    self._pending_sizes[entry.name] = (size, time.monotonic())
+                elif size > 0 and time.monotonic() - pending[1] >= STABLE_CHECK_INTERVAL:
+                    del self._pending_sizes[entry.name]
+                    self._known.add(entry.name)
+                    self.files.put(entry.path)
+
+    def wait_for_file(self, prefix, timeout=60):
+        """
+        Wait for a finished download whose filename starts with prefix.
+
+        Args:
+            prefix (str): Export filename prefix, e.g. "forRentExport"
+            timeout (int): Seconds to wait before giving up
+
+        Files that were already in the directory when the watcher started, or
+        that an earlier wait returned, are never returned again.
+
+        Returns:
+            str: Path of the downloaded file, or None on timeout
+        """
+        # A file for another prefix may have been picked up by an earlier wait
+        for name in self._unclaimed:
+            if name.startswith(prefix):
+                return self._claim(self._unclaimed.pop(name))
+
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                # The observer can miss events (e.g. on network filesystems), so diff the directory,
+                # only accepting a file whose size has stopped changing
+                path = new_since(self.directory, prefix, self._claimed)
+                return self._claim(path) if path and is_stable(path) else None
+            if self._observer is None:
+                self._poll()
+            try:
+                # With an observer events arrive on the queue; otherwise rescan every POLL_INTERVAL
+                path = self.files.get(timeout=min(remaining, 0.25 if self._observer else POLL_INTERVAL))
+            except queue.Empty:
+                continue
+            name = os.path.basename(path)
+            if name.startswith(prefix):
+                return self._claim(path)
+            self._unclaimed[name] = path
+
+    def _claim(self, path):
+        """Record path as handed out and return it."""
+        self._claimed.add(os.path.basename(path))
+        return path
+
+    def stop(self):
+        """Stop the observer thread if one is running."""
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=2)
+            except Exception as e:
+                logger.warning(f"Error stopping download observer: {e}")
+            self._observer = None
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# Pool of pre-warmed Chrome drivers shared by RP Data scraper jobs
+
+import os
+import sys
+import time
+import queue
+import signal
+import atexit
+import logging
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # No flock on this platform - drivers fall back to throwaway profiles
+    fcntl = None
+
+try:
+    import psutil
+except ImportError:
+    # Without psutil the browser PID is unknown and a hung quit() can't be cleaned up
+    psutil = None
+
+# Add the parent directory to the path if it isn't already there
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if package_dir not in sys.path:
+    sys.path.append(package_dir)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Anti-detection patches, registered once per driver and run at document start in every frame
+ANTI_DETECT_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-AU', 'en']});
+"""
+
+# How long quit() gets before the browser process is killed, in seconds
+QUIT_TIMEOUT = 10
+
+# Images, fonts, media and trackers the scraper never needs to load
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.mp4", "*.ico",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*hotjar*", "*segment.io*"
+]
+
+
+def warm_driver(driver):
+    """
+    One-time preparation for a freshly launched driver.
+
+    Runs when the driver is created for the pool so jobs that acquire it
+    don't pay for the first chromedriver round-trip. The anti-detection
+    script is registered before the first navigation so no page ever sees
+    the unpatched navigator.
+    """
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": ANTI_DETECT_JS})
+        # Keep the HTTP cache warm across searches
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+    except Exception as e:
+        logger.warning(f"CDP setup failed: {e}")
+
+    try:
+        driver.get("about:blank")
+    except Exception as e:
+        logger.warning(f"Could not warm driver: {e}")
+
+
+def browser_pid(driver):
+    """
+    Return the PID of the Chrome browser process behind a driver, or None.
+
+    Chrome is a child of the driver's own chromedriver process; the browser
+    process is the one without a --type= switch (renderers, GPU etc. have one).
+    Drivers on the shared chromedriver have no service of their own, so their
+    browser can't be told apart and None is returned.
+    """
+    service_process = getattr(getattr(driver, 'service', None), 'process', None)
+    if psutil is None or service_process is None:
+        return None
+    try:
+        for child in psutil.Process(service_process.pid).children(recursive=True):
+            try:
+                if 'chrom' in child.name().lower() and not any(
+                        arg.startswith('--type=') for arg in child.cmdline()):
+                    return child.pid
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    except Exception as e:
+        logger.warning(f"Could not read Chrome browser PID: {e}")
+    return None
+
+
+def kill_browser(pid, grace=0.3):
+    """SIGTERM a Chrome process that outlived quit(), then SIGKILL it after a short grace period."""
+    for sig in (signal.SIGTERM, getattr(signal, 'SIGKILL', signal.SIGTERM)):
+        try:
+            os.kill(pid, sig)
+        except (ProcessLookupError, PermissionError, OSError):
+            return
+        time.sleep(grace)
+
+
+def claim_profile_dir(max_profiles=8):
+    """
+    Claim a persistent Chrome profile directory no other driver is using.
+
+    Profiles live at ~/.rpdata_profile_<n>; each is guarded by an flock on a
+    sibling lockfile so parallel drivers and processes never share one.
+
+    Returns:
+        Tuple of (profile directory, open lock file), or (None, None) if no
+        profile could be claimed
+    """
+    if fcntl is None:
+        return None, None
+
+    base = os.path.join(os.path.expanduser("~"), ".rpdata_profile")
+    for n in range(max_profiles):
+        profile_dir = f"{base}_{n}"
+        lock_file = None
+        try:
+            lock_file = open(f"{profile_dir}.lock", "w")
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return profile_dir, lock_file
+        except OSError:
+            if lock_file:
+                lock_file.close()
+            continue
+
+    logger.warning("All persistent Chrome profiles are in use, using a temporary profile")
+    return None, None
+
+
+class DriverPool:
+    """
+    Keeps a small number of Chrome drivers warm between jobs.
+
+    Drivers are created with setup_chrome_driver, handed out by acquire()
+    and put back by release() instead of being quit. Each headless mode
+    gets its own queue since the flag can't be changed after launch.
+    """
+
+    def __init__(self, min_size=1, max_size=None, headless=True):
+        self.min_size = min_size
+        self.max_size = max(max_size if max_size is not None else min_size, min_size)
+        self.headless = headless
+        self._queues = {True: queue.Queue(), False: queue.Queue()}
+        self._lock = threading.Lock()
+        self._closed = False
+        # Profile lockfiles and Chrome PIDs held for each live driver, keyed by id(driver)
+        self._profile_locks = {}
+        self._browser_pids = {}
+
+        # Refill to min_size in the background so startup isn't blocked
+        if self.min_size > 0:
+            refill_thread = threading.Thread(target=self._refill, args=(headless,))
+            refill_thread.daemon = True
+            refill_thread.start()
+
+    def _create_driver(self, headless):
+        """Launch a new Chrome driver and run the one-time warm-up."""
+        # Imported here so loading the pool module doesn't pull in Selenium
+        from chrome_utils import setup_chrome_driver
+        
+        profile_dir, profile_lock = claim_profile_dir()
+        driver = setup_chrome_driver(headless=headless, user_data_dir=profile_dir)
+        if driver is None:
+            if profile_lock:
+                profile_lock.close()
+            return None
+        if profile_lock:
+            self._profile_locks[id(driver)] = profile_lock
+        self._browser_pids[id(driver)] = browser_pid(driver)
+        warm_driver(driver)
+        return driver
+
+    def _refill(self, headless):
+        """Top the pool up to min_size warm drivers."""
+        pool_queue = self._queues[headless]
+        while not self._closed and pool_queue.qsize() < self.min_size:
+            driver = self._create_driver(headless)
+            if driver is None:
+                logger.warning("Driver pool refill failed, will retry on next acquire")
+                return
+            pool_queue.put(driver)
+            logger.info(f"Driver pool warmed: {pool_queue.qsize()}/{self.min_size} (headless={headless})")
+
+    def acquire(self, headless, download_dir=None, block_resources=True):
+        """
+        Get a warm driver from the pool, launching a new one if none are idle.
+
+        Args:
+            headless (bool): Whether the driver should be headless
+            download_dir (str): Directory downloads should be saved to for this job
+            block_resources (bool): Block images, fonts, media and trackers
+
+        Returns:
+            WebDriver instance, or None if Chrome could not be started
+        """
+        try:
+            driver = self._queues[headless].get_nowait()
+            logger.info("Acquired warm driver from pool")
+        except queue.Empty:
+            logger.info("No warm driver available, launching a new one")
+            driver = self._create_driver(headless)
+
+        if driver is None:
+            return None
+
+        # Point downloads at the job's directory
+        if download_dir:
+            from chrome_utils import set_download_dir
+            set_download_dir(driver, download_dir)
+
+        # Always set the list so a reused driver doesn't keep the previous job's setting
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                "urls": BLOCKED_URL_PATTERNS if block_resources else []
+            })
+        except Exception as e:
+            logger.warning(f"CDP resource blocking setup failed: {e}")
+
+        return driver
+
+    def release(self, driver, headless):
+        """
+        Return a driver to the pool, quitting it if the pool is already full.
+
+        Args:
+            driver: WebDriver previously returned by acquire()
+            headless (bool): Headless mode the driver was acquired with
+        """
+        pool_queue = self._queues[headless]
+        with self._lock:
+            if self._closed or pool_queue.qsize() >= self.max_size:
+                self._quit(driver)
+                return
+            pool_queue.put(driver)
+        logger.info(f"Driver returned to pool ({pool_queue.qsize()}/{self.max_size} idle)")
+
+    def discard(self, driver):
+        """Quit a driver that is broken and should not be reused."""
+        self._quit(driver)
+
+    def _quit(self, driver, wait=False):
+        """
+        Quit a driver and make sure its Chrome process is gone.
+
+        Teardown runs in a background thread unless wait is set, so callers
+        don't block on quit(); if quit() raises or takes longer than
+        QUIT_TIMEOUT, the browser is killed by PID.
+        """
+        pid = self._browser_pids.pop(id(driver), None)
+        profile_lock = self._profile_locks.pop(id(driver), None)
+
+        def teardown():
+            quit_done = threading.Event()
+            quit_errors = []
+
+            def quit_driver():
+                try:
+                    driver.quit()
+                except Exception as e:
+                    quit_errors.append(e)
+                finally:
+                    quit_done.set()
+
+            quit_thread = threading.Thread(target=quit_driver)
+            quit_thread.daemon = True
+            quit_thread.start()
+            # Only a quit() that raised or hung can leave Chrome behind
+            if not quit_done.wait(QUIT_TIMEOUT) or quit_errors:
+                logger.warning(f"Error quitting pooled driver: {quit_errors[0] if quit_errors else 'timed out'}")
+                if pid:
+                    kill_browser(pid)
+            # Closing the lockfile drops the flock so the profile can be claimed again
+            if profile_lock:
+                profile_lock.close()
+
+        if wait:
+            teardown()
+        else:
+            teardown_thread = threading.Thread(target=teardown)
+            teardown_thread.daemon = True
+            teardown_thread.start()
+
+    def close_all(self):
+        """Quit every idle driver in the pool."""
+        with self._lock:
+            self._closed = True
+        for pool_queue in self._queues.values():
+            while True:
+                try:
+                    driver = pool_queue.get_nowait()
+                except queue.Empty:
+                    break
+                # Wait here since daemon threads don't survive interpreter exit
+                self._quit(driver, wait=True)
+        logger.info("Driver pool closed")
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(headless=True):
+    """Return the process-wide driver pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            pool_size = int(os.environ.get('RPDATA_POOL_SIZE', '1'))
+            # Keep a released driver for each concurrent search worker so later jobs start warm
+            max_size = int(os.environ.get('RPDATA_SEARCH_WORKERS', '3'))
+            _pool = DriverPool(min_size=pool_size, max_size=max_size, headless=headless)
+            atexit.register(_pool.close_all)
+        return _pool
+
+
+def acquire(headless, download_dir=None, block_resources=True):
+    """Acquire a driver from the process-wide pool."""
+    return get_pool(headless).acquire(headless, download_dir, block_resources)
+
+
+def release(driver, headless):
+    """Release a driver back to the process-wide pool."""
+    get_pool(headless).release(driver, headless)
@@ -1,17 +1,23 @@
 #!/usr/bin/env python3
 # Base functionality for RP Data scraper
 
+import enum
+import json
 import time
 import random
 import logging
 import os
 import sys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from types import MappingProxyType
+from collections import namedtuple
+from urllib.parse import urlsplit
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from chrome_utils import setup_chrome_driver
+# Add this directory to the path if it isn't already there
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+import driver_pool
+from download_watcher import DownloadWatcher
 
 
 
@@ -19,75 +25,316 @@ from chrome_utils import setup_chrome_driver
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Search types in the order a job runs them: the job progress range each covers and the
+# filename prefix RP Data gives its export. Names are interned so lookups compare by identity first.
+SearchSpec = namedtuple('SearchSpec', 'name start end prefix')
+SEARCH_SPECS = (
+    SearchSpec(sys.intern("For Rent"), 20, 45, "forRentExport"),
+    SearchSpec(sys.intern("For Sale"), 50, 75, "forSaleExport"),
+    SearchSpec(sys.intern("Sales"), 78, 90, "recentSaleExport"),
+)
+SEARCH_TYPES = tuple(spec.name for spec in SEARCH_SPECS)
+PREFIX_MAP = MappingProxyType({spec.name: spec.prefix for spec in SEARCH_SPECS})
+
+class FloorArea(int, enum.Enum):
+    """Sentinels for an unbounded floor area filter (RP Data's "Min"/"Max")."""
+    MIN = 0
+    MAX = 9_999_999_999
+
+def coerce_floor_area(value, default=FloorArea.MIN):
+    """
+    Convert a floor area from the request into an int, once, at the job boundary.
+
+    "Min", "Max", None and "" map to the FloorArea sentinels; anything else must
+    be a whole number or a ValueError is raised before any browser work starts.
+    """
+    if isinstance(value, FloorArea):
+        return value
+    if value is None or str(value).strip() in ("", "Min", "Max"):
+        return FloorArea.MAX if value == "Max" else default
+    return int(str(value).strip())
+
+# Sets an input's value in one round-trip and fires the events the page listens for.
+# The native setter is used so React-controlled inputs register the change.
+SET_VALUE_JS = """
+arguments[0].focus();
+Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(arguments[0], arguments[1]);
+arguments[0].dispatchEvent(new Event('input', {bubbles: true}));
+arguments[0].dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Resolves with [element, index] for the first selector matching a visible, enabled element.
+# Selectors starting with "/" or "(" are XPath, anything else is CSS. Every match of a
+# selector is checked in the page, so hidden duplicates are skipped without an
+# is_displayed() round-trip each. A MutationObserver re-checks on every DOM change so
+# there's no polling interval.
+WAIT_FOR_XPATH_JS = """
+var xpaths = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+function matches(selector) {
+    if (selector[0] !== '/' && selector[0] !== '(') return document.querySelectorAll(selector);
+    var nodes = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var list = [];
+    for (var j = 0; j < nodes.snapshotLength; j++) list.push(nodes.snapshotItem(j));
+    return list;
+}
+function find() {
+    for (var i = 0; i < xpaths.length; i++) {
+        var nodes = matches(xpaths[i]);
+        for (var j = 0; j < nodes.length; j++) {
+            var el = nodes[j];
+            if (el.getClientRects().length > 0 && !el.disabled) return [el, i];
+        }
+    }
+    return null;
+}
+var hit = find();
+if (hit) { done(hit); return; }
+var timer = null;
+var observer = new MutationObserver(function() {
+    var hit = find();
+    if (hit) { observer.disconnect(); clearTimeout(timer); done(hit); }
+});
+observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+timer = setTimeout(function() { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+# Directories this process has already created, so repeat jobs skip the mkdir syscalls
+_created_dirs = set()
+
+def ensure_dir(path):
+    """Create path (and parents) unless this process already has."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+def forget_dir(path):
+    """Drop path from the created-directory cache after removing it."""
+    _created_dirs.discard(path)
+
+# Poll fast instead of the 500ms default - most elements are already there
+WAIT_POLL_FREQUENCY = 0.05
+
+# Selenium helpers, imported on first use so runs that never touch the browser don't pay for them
+_sel = {}
+
+def _lazy():
+    """Import the Selenium wait helpers once and cache them in _sel."""
+    if not _sel:
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common import exceptions
+        _sel.update({
+            'WebDriverWait': WebDriverWait,
+            'EC': EC,
+            'exceptions': exceptions,
+            'ignored': (exceptions.StaleElementReferenceException, exceptions.NoSuchElementException)
+        })
+    return _sel
+
 class RPDataBase:
-    def __init__(self, headless=False, download_dir=None):
+    # "keys" sends real keystrokes for slow typing, "js" always sets the value directly
+    _typing_mode = "keys"
+    
+    def __init__(self, headless=False, download_dir=None, block_resources=True):
         """Initialize the scraper with Undetected ChromeDriver."""
         # If no download directory specified, use default
         if download_dir is None:
             download_dir = os.path.join(os.getcwd(), "downloads")
         
         # Ensure the download directory exists
-        os.makedirs(download_dir, exist_ok=True)
+        ensure_dir(download_dir)
         
         self.download_dir = download_dir
-        self.driver = setup_chrome_driver(headless=headless, download_dir=self.download_dir)
+        # Start watching before any export is triggered so no download is missed
+        self.download_watcher = DownloadWatcher(download_dir)
+        self.last_download = None
+        # Set once this scraper has seen the dashboard, so login checks skip the DOM
+        self._logged_in = False
+        self.headless = headless
+        # Human-like pauses are only needed when RP Data's bot detection is a concern
+        self._stealth = os.environ.get("RPDATA_STEALTH") == "1"
+        # Set to False to load images/fonts when debugging the page visually
+        self.block_resources = block_resources
+        self.driver = self.setup_driver(headless)
+        # WebDriverWait instances by timeout, built on first use
+        self._waits = {}
+        # Winning selector per selector tuple, tried first on the next wait_for_any_xpath
+        self._selector_hits = {}
         self.login_url = "https://rpp.corelogic.com.au/"
+        # Site root, parsed once for the last dashboard fallback
+        login_parts = urlsplit(self.login_url)
+        self.base_url = f"{login_parts.scheme}://{login_parts.netloc}"
+    
+    def setup_driver(self, headless):
+        """Acquire a warm Chrome driver from the shared pool for this scraper."""
+        return driver_pool.acquire(headless, download_dir=self.download_dir,
+                                   block_resources=self.block_resources)
     
     def random_delay(self, min_sec=0.1, max_sec=0.2):
-        """Add a minimal random delay between actions."""
-        delay = random.uniform(min_sec, max_sec)
-        time.sleep(delay)
+        """Add a minimal random delay between actions (stealth mode only)."""
+        if not self._stealth:
+            return
+        time.sleep(random.uniform(min_sec, max_sec))
     
     def human_like_typing(self, element, text, speed="normal"):
         """
         Type text with human-like delays between keypresses.
-        
+
+        "normal" and "fast" set the value in one JavaScript call and fire the
+        input/change events; real keystrokes are only sent for "slow" typing
+        when _typing_mode is "keys". "fast" is for fields behind the login,
+        where there's no input timing to mimic, and returns without pausing.
+
         Args:
             element: The element to type into
             text: The text to type
             speed: Speed of typing - "slow", "normal", or "fast"
         """
+        if speed != "slow" or self._typing_mode != "keys":
+            self.driver.execute_script(SET_VALUE_JS, element, text)
+            if speed == "normal":
+                # Small upper bound for pages that sniff paste-like input timing
+                time.sleep(len(text) * 0.002)
+            return
+
         # Focus the element directly
         self.driver.execute_script("arguments[0].focus();", element)
         
         # Clear any existing value while preserving focus
         self.driver.execute_script("arguments[0].value = '';", element)
         
-        # Type with appropriate delays based on speed
-        if speed == "slow":
-            delay_min, delay_max = 0.05, 0.15  # Slower typing
-        elif speed == "normal":
-            delay_min, delay_max = 0.01, 0.05  # Normal typing
-        else:  # fast
-            delay_min, delay_max = 0.003, 0.008  # Very fast typing
-        
-        # Type character by character
+        # Slow typing delays between keypresses
+        delay_min, delay_max = 0.05, 0.15
+
+        # Queue every keystroke and pause into one W3C Actions request so the
+        # delays run inside chromedriver rather than as a round-trip per character
+        from selenium.webdriver.common.action_chains import ActionChains
+        actions = ActionChains(self.driver, duration=int(random.uniform(delay_min, delay_max) * 1000))
         for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(delay_min, delay_max))
+            actions.send_keys(char).pause(random.uniform(delay_min, delay_max))
+        actions.perform()
+    
+    def _wait(self, timeout):
+        """Return this scraper's WebDriverWait for timeout, building it on first use."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            sel = _lazy()
+            wait = self._waits[timeout] = sel['WebDriverWait'](
+                self.driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY, ignored_exceptions=sel['ignored'])
+        return wait
+    
+    def run_js(self, script, *args):
+        """
+        Run an execute_script-style script through CDP's Runtime.evaluate.
+
+        Skips the WebDriver script wrapper and argument marshalling, so it's
+        cheaper on hot paths. Only for scripts whose arguments and return value
+        are plain JSON - element arguments or results still need execute_script.
+
+        Returns:
+            The script's return value, or None if it returned nothing
+        """
+        expression = f"(function() {{{script}}}).apply(null, {json.dumps(args)})"
+        response = self.driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True
+        })
+        if "exceptionDetails" in response:
+            raise _lazy()['exceptions'].JavascriptException(
+                response["exceptionDetails"].get("exception", {}).get("description", "Script failed"))
+        return response.get("result", {}).get("value")
     
     def wait_and_find_element(self, by, value, timeout=5):
         """Wait for an element to be present and return it."""
+        sel = _lazy()
+        
+        # Fast path - after a page has loaded the element is usually already there
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
-            )
+            return self.driver.find_element(by, value)
+        except sel['exceptions'].NoSuchElementException:
+            pass
+        
+        try:
+            element = self._wait(timeout).until(sel['EC'].presence_of_element_located((by, value)))
             return element
-        except TimeoutException:
+        except sel['exceptions'].TimeoutException:
             logger.error(f"Timed out waiting for element: {value}")
             return None
     
     def wait_and_find_clickable(self, by, value, timeout=5):
         """Wait for an element to be clickable and return it."""
+        sel = _lazy()
+        exceptions = sel['exceptions']
+        
+        # Fast path - skip the wait if the element is already visible and enabled
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
-            )
+            element = self.driver.find_element(by, value)
+            if element.is_displayed() and element.is_enabled():
+                return element
+        except (exceptions.NoSuchElementException, exceptions.ElementNotInteractableException,
+                exceptions.StaleElementReferenceException):
+            pass
+        
+        try:
+            element = self._wait(timeout).until(sel['EC'].element_to_be_clickable((by, value)))
             return element
-        except TimeoutException:
+        except exceptions.TimeoutException:
             logger.error(f"Timed out waiting for clickable element: {value}")
             return None
     
+    def wait_until(self, condition, timeout=5):
+        """
+        Wait for a WebDriverWait condition without raising on timeout.
+
+        Used in place of fixed sleeps so each step continues as soon as the
+        page is ready.
+
+        Returns:
+            The condition's truthy result, or None on timeout
+        """
+        sel = _lazy()
+        try:
+            return self._wait(timeout).until(condition)
+        except sel['exceptions'].TimeoutException:
+            return None
+    
+    def wait_for_any_xpath(self, xpaths, timeout=5):
+        """
+        Wait for the first of several selectors to match a visible, enabled element.
+
+        Selectors are checked in order on every DOM mutation, so this returns as
+        soon as the element appears instead of polling each selector in turn.
+        Each may be XPath (starting with "/" or "(") or a CSS selector.
+
+        For a tuple (the module-level selector constants) the selector that
+        matched last time is tried first, so repeat searches skip the ones
+        that never match on this site.
+
+        Returns:
+            Tuple of (element, matching selector), or (None, None) on timeout
+        """
+        preferred = self._selector_hits.get(xpaths) if isinstance(xpaths, tuple) else None
+        if preferred:
+            ordered = [preferred] + [xpath for xpath in xpaths if xpath != preferred]
+        else:
+            ordered = list(xpaths)
+        
+        try:
+            result = self.driver.execute_async_script(WAIT_FOR_XPATH_JS, ordered, int(timeout * 1000))
+        except Exception as e:
+            logger.warning(f"Error waiting for elements: {e}")
+            return None, None
+        
+        if not result:
+            logger.debug(f"Timed out waiting for any of: {xpaths}")
+            return None, None
+        
+        element, index = result
+        selector = ordered[int(index)]
+        if isinstance(xpaths, tuple):
+            self._selector_hits[xpaths] = selector
+        return element, selector
+    
     def safe_click(self, element, retries=1):
         """Attempt to click an element with retries."""
         for i in range(retries + 1):  # +1 to include initial attempt
@@ -105,16 +352,33 @@ class RPDataBase:
                 except Exception as e:
                     if i < retries:
                         logger.warning(f"Click failed: {e}, retrying")
-                        self.random_delay(0.05, 0.08)  # Minimal delay between retries
         
         logger.error("Failed to click element")
         return False
     
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        # Always hand the driver back, including when a step raised
+        self.close()
+        return False
+    
     def close(self):
-        """Close the browser and release resources."""
+        """Reset the browser and return it to the driver pool."""
+        if hasattr(self, 'download_watcher'):
+            self.download_watcher.stop()
+        
         if hasattr(self, 'driver') and self.driver:
+            driver = self.driver
+            self.driver = None
             try:
-                self.driver.quit()
-                logger.info("Browser closed successfully")
+                # Cookies are kept so the next job can reuse the login session
+                driver.get("about:blank")
             except Exception as e:
-                logger.error(f"Error closing browser: {e}")
\ No newline at end of file
+                # A driver that can't be reset isn't safe to hand to the next job
+                logger.error(f"Error resetting browser, discarding it: {e}")
+                driver_pool.get_pool(self.headless).discard(driver)
+                return
+            driver_pool.release(driver, self.headless)
+            logger.info("Browser released to pool")
\ No newline at end of file
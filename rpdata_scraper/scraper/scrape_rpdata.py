@@ -4,12 +4,385 @@
 
 import os
 import sys
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from setup_rpdata_scraper import RPDataScraper, logger
+import json
+import time
+import queue
+import weakref
+import threading
+import shutil
+import tempfile
+import functools
+import itertools
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Make sibling modules and the package root importable, without duplicating path entries on re-import
+scraper_dir = os.path.dirname(os.path.abspath(__file__))
+for path in (scraper_dir, os.path.dirname(scraper_dir)):
+    if path not in sys.path:
+        sys.path.append(path)
+
+# Selenium is only imported once a browser search runs, so the RPDATA_USE_API=1 path doesn't load it
+from rpdata_base import (logger, SEARCH_SPECS, SEARCH_TYPES, PREFIX_MAP, FloorArea, coerce_floor_area, ensure_dir,
+                         forget_dir)
+import csv_cache
+import api_client
+
+# scraper/scrape_rpdata.py is the single implementation main.py imports
+__all__ = ['scrape_rpdata']
+
+# Overall job progress milestones, matching main.py and app.py
+PROGRESS_MILESTONES = MappingProxyType({
+    'start': 5,
+    'login_start': 8,
+    'login_complete': 15,
+    'rent_start': 20,
+    'rent_complete': 45,
+    'sale_start': 50,
+    'sale_complete': 75,
+    'sales_start': 78,
+    'sales_complete': 90
+})
+
+# Non-milestone progress updates closer together than this are coalesced, in seconds
+PROGRESS_DEBOUNCE = 0.2
+MILESTONE_PERCENTAGES = frozenset(PROGRESS_MILESTONES.values())
+
+# Share of a search type's work done once it reaches each stage
+SEARCH_SUBSTEPS = MappingProxyType({
+    'start': 0.0, 'locations': 0.2, 'filters': 0.4, 'selection': 0.6, 'export': 0.8, 'done': 1.0
+})
+
+# (search_type, stage) -> absolute progress percentage, computed once at import
+SEARCH_PROGRESS = MappingProxyType({
+    (spec.name, step): int(spec.start + (spec.end - spec.start) * frac)
+    for spec in SEARCH_SPECS
+    for step, frac in SEARCH_SUBSTEPS.items()
+})
+
+# Per-search-type view of SEARCH_PROGRESS in the shape apply_filters expects
+SEARCH_MILESTONES = MappingProxyType({
+    search_type: MappingProxyType({step: SEARCH_PROGRESS[(search_type, step)] for step in SEARCH_SUBSTEPS})
+    for search_type in SEARCH_TYPES
+})
+
+# Overall job progress for every combination of stages the concurrent searches can be at
+# (a tuple in SEARCH_TYPES order): their average completion mapped onto rent_start..sales_complete
+JOB_PROGRESS = MappingProxyType({
+    stages: int(PROGRESS_MILESTONES['rent_start'] +
+                sum(SEARCH_SUBSTEPS[stage] for stage in stages) / len(stages) *
+                (PROGRESS_MILESTONES['sales_complete'] - PROGRESS_MILESTONES['rent_start']))
+    for stages in itertools.product(SEARCH_SUBSTEPS, repeat=len(SEARCH_TYPES))
+})
+
+# Scratch space for in-progress exports; tmpfs keeps Chrome's writes off the disk
+TMPFS_DIR = "/dev/shm"
+
+# RP Data host, pre-resolved at the start of each job
+RPDATA_URL = "https://rpp.corelogic.com.au/"
+
+# Never set - stands in for a cancel event when the caller has no way to cancel
+_NEVER = threading.Event()
+
+# Per-search steps: (stage, RPDataScraper method, argument names, progress message, failure message)
+SEARCH_STEPS = (
+    ('start', 'select_search_type', ('search_type',),
+     "Starting {st} search...", "Failed to select search type: {st}"),
+    ('locations', 'search_locations', ('locations', 'search_type'),
+     "Searching locations for {st}...", "Failed to search locations for: {st}"),
+    ('filters', 'apply_filters',
+     ('property_types', 'min_floor_area', 'max_floor_area', 'filter_progress', 'milestones', 'search_type'),
+     "Applying filters for {st}...", "Failed to apply filters for: {st}"),
+    ('selection', 'select_all_results', (),
+     "Selecting results for {st}...", "Failed to select all results for: {st}"),
+    ('export', 'export_to_csv', ('search_type',),
+     "Exporting {st} data...", "Failed to export to CSV for: {st}"),
+)
+
+# RP Data account every job logs in with, over the browser and the API alike
+RPDATA_CREDENTIALS = ("busihealth", "Busihealth123")
+
+# How long a worker waits for another worker's login before logging in itself, in seconds
+SHARED_LOGIN_TIMEOUT = 60
+
+# Origin the shared sessionStorage belongs to
+RPDATA_ORIGIN = RPDATA_URL.rstrip('/')
+
+# Seeds sessionStorage from a captured session at document start, on the RP Data origin only
+SEED_STORAGE_JS = """
+if (location.origin === %s) {
+    var items = JSON.parse(%s);
+    for (var key in items) { sessionStorage.setItem(key, items[key]); }
+}
+"""
+
+# Pooled drivers that have logged in during this process; entries drop out once a driver is quit and collected
+_LOGGED_IN_DRIVERS = weakref.WeakSet()
+
+
+def _verify_session(scraper, timeout=5, navigate=True):
+    """
+    Check that a driver's RP Data session is authenticated.
+
+    Args:
+        navigate: Load the login URL first; pass False to check the page already loaded
+    """
+    try:
+        if navigate:
+            scraper.driver.get(scraper.login_url)
+        # The scraper's cached wait polls every WAIT_POLL_FREQUENCY, so each worker resumes sooner
+        if scraper.wait_until(lambda driver: scraper.is_logged_in(), timeout=timeout):
+            return True
+    except Exception as e:
+        logger.debug(f"Session check failed: {e}")
+    logger.info("Previous session has expired, logging in again")
+    return False
+
+
+class _SharedSession:
+    """
+    One RP Data login shared by the concurrent search workers of a job.
+
+    The first worker to get here logs in with credentials and captures the
+    session's cookies and sessionStorage; the others wait for it and restore
+    that session into their own driver, in parallel, instead of logging in again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Set once the leading worker's login has finished, whether or not it succeeded
+        self._ready = threading.Event()
+        self._leading = False
+        self.cookies = None
+        self.storage = None
+
+    def capture(self, driver):
+        """Record the authenticated session from a logged-in driver."""
+        try:
+            # CDP returns cookies for every domain the login touched, not just the current one
+            cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+            # Leave out the API capture log - it belongs to the driver that recorded it
+            storage = driver.execute_script(
+                "var items = Object.assign({}, sessionStorage); delete items[arguments[0]];"
+                "return JSON.stringify(items);", api_client.CAPTURE_KEY)
+        except Exception as e:
+            logger.warning(f"Could not capture the login session: {e}")
+            return
+        with self._lock:
+            self.cookies, self.storage = cookies, storage
+
+    def restore(self, scraper):
+        """Inject the captured session into scraper's driver. Returns True if it is logged in."""
+        driver = scraper.driver
+        script_id = None
+        try:
+            driver.execute_cdp_cmd('Network.setCookies', {'cookies': self.cookies})
+            if self.storage:
+                # Seed sessionStorage before the app's own scripts run, so the single load below
+                # already starts from the shared session
+                script_id = driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
+                    'source': SEED_STORAGE_JS % (json.dumps(RPDATA_ORIGIN), json.dumps(self.storage))
+                })['identifier']
+            driver.get(scraper.login_url)
+        except Exception as e:
+            logger.warning(f"Could not restore the shared login session: {e}")
+            return False
+        finally:
+            if script_id is not None:
+                try:
+                    driver.execute_cdp_cmd('Page.removeScriptToEvaluateOnNewDocument', {'identifier': script_id})
+                except Exception as e:
+                    logger.debug(f"Could not remove the session seeding script: {e}")
+        return _verify_session(scraper, navigate=False)
+
+    def offer(self, driver):
+        """Capture the session from an already logged-in driver if none has been captured yet."""
+        if self.cookies is None:
+            self.capture(driver)
+        if self.cookies is not None:
+            self._ready.set()
+
+    def login(self, scraper, username, password):
+        """Log scraper in, reusing the shared session when there is one."""
+        with self._lock:
+            lead = self.cookies is None and not self._leading
+            if lead:
+                self._leading = True
+
+        if lead:
+            try:
+                if not scraper.login(username, password):
+                    return False
+                self.capture(scraper.driver)
+                return True
+            finally:
+                self._ready.set()
+
+        # Another worker is logging in - wait for it, then restore its session without the lock
+        self._ready.wait(SHARED_LOGIN_TIMEOUT)
+        if self.cookies and self.restore(scraper):
+            logger.info("Reusing this job's login session")
+            return True
+        # No session came through, or it was rejected (redirected to login) - log in with credentials
+        if not scraper.login(username, password):
+            return False
+        self.offer(scraper.driver)
+        return True
+
+
+def _make_staging_dir():
+    """
+    Create a fresh scratch directory on tmpfs when available.
+
+    Falls back to the system temp directory where /dev/shm doesn't exist or isn't writable.
+    The caller moves the results out and removes it with _persist_downloads().
+    """
+    if sys.platform.startswith('linux') and os.access(TMPFS_DIR, os.W_OK):
+        return tempfile.mkdtemp(prefix="rpdata-", dir=TMPFS_DIR)
+    return tempfile.mkdtemp(prefix="rpdata-")
+
+
+def _persist_downloads(result_files, staging_dir, target_dir):
+    """Move exports from the scratch directory to target_dir, updating result_files in place."""
+    for search_type, file_path in list(result_files.items()):
+        try:
+            target = os.path.join(target_dir, os.path.basename(file_path))
+            shutil.move(file_path, target)
+            result_files[search_type] = target
+        except Exception as e:
+            logger.error(f"Could not move {file_path} to {target_dir}: {e}")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    for search_type_dir in PREFIX_MAP.values():
+        forget_dir(os.path.join(staging_dir, search_type_dir))
+    forget_dir(staging_dir)
+
+
+def _warm_connection(url=RPDATA_URL):
+    """HEAD the RP Data host so DNS and TLS are warm before Chrome's first navigation."""
+    try:
+        import requests
+        requests.head(url, timeout=5)
+    except Exception as e:
+        logger.debug(f"Connection warm-up failed: {e}")
+
+
+def _noop_progress(percentage, message):
+    """Default progress callback: ignore the update and never ask to cancel."""
+    return True
+
+
+def _report_stage(step, stage, percentage, message):
+    """Adapt a (percentage, message) progress callback to a worker's stage-based report."""
+    return step(stage, message)
+
+
+def _checkpoint(progress_callback, cancel_event, pct, msg):
+    """Report progress unless cancelled; returns False if the job should stop."""
+    return not cancel_event.is_set() and progress_callback(pct, msg) is not False
+
+
+def _run_one_search(search_type, locations, property_types, min_floor_area, max_floor_area,
+                    headless, download_dir, milestones, report, cancel_event=_NEVER, session=None):
+    """
+    Run login, search, filter and export for one search type on its own driver.
+    
+    Args:
+        search_type: "For Rent", "For Sale" or "Sales"
+        download_dir: Directory this search's export is downloaded to
+        milestones: Absolute progress milestones for this search type
+        report: Thread-safe function(search_type, stage, message) returning False on cancellation
+        cancel_event: threading.Event that is set when the job should be cancelled
+        session: _SharedSession used to log in once per job rather than once per worker
+    
+    Returns:
+        Tuple of (search_type, downloaded file path or None)
+    """
+    logger.info(f"\n===== STARTING SEARCH TYPE: {search_type} =====\n")
+    
+    try:
+        if cancel_event.is_set():
+            logger.info(f"Job cancelled before {search_type} search")
+            return search_type, None
+        
+        # Reuse a recent export of the same search if one is cached (only with RPDATA_CACHE=1)
+        key = csv_cache.cache_key(search_type, locations, property_types, min_floor_area, max_floor_area)
+        cached_file = csv_cache.get(key, download_dir)
+        if cached_file:
+            logger.info(f"Added cached file for {search_type}: {os.path.basename(cached_file)}")
+            report(search_type, 'done', f"Using cached {search_type} data...")
+            return search_type, cached_file
+        
+        from setup_rpdata_scraper import RPDataScraper
+        
+        # The scraper returns its driver to the pool however this block exits
+        with RPDataScraper(headless=headless, download_dir=download_dir) as scraper:
+            scraper.check_cancelled = cancel_event.is_set
+            step = functools.partial(report, search_type)
+            
+            # A driver that already logged in during this process can skip the login flow
+            if scraper.driver in _LOGGED_IN_DRIVERS and _verify_session(scraper):
+                logger.info("Reusing logged-in session from a previous job")
+                if session is not None:
+                    session.offer(scraper.driver)
+            elif (session or _SharedSession()).login(scraper, *RPDATA_CREDENTIALS):
+                _LOGGED_IN_DRIVERS.add(scraper.driver)
+            else:
+                logger.error(f"Login failed, skipping {search_type}")
+                return search_type, None
+            
+            # Record the SPA's own requests so the API endpoints can be mapped - only from here on,
+            # so the login request never passes through the capture
+            capture_api = os.environ.get('RPDATA_CAPTURE_API') == '1'
+            if capture_api:
+                api_client.enable_capture(scraper.driver)
+            
+            if not _checkpoint(step, cancel_event, 'login', "Login successful. Searching..."):
+                logger.info(f"Job cancelled after login for {search_type}")
+                return search_type, None
+            
+            # Run each step in order, reporting its progress and checking for cancellation first
+            step_args = {
+                'search_type': search_type,
+                'locations': locations,
+                'property_types': property_types,
+                'min_floor_area': min_floor_area,
+                'max_floor_area': max_floor_area,
+                'filter_progress': functools.partial(_report_stage, step, 'filters'),
+                'milestones': milestones
+            }
+            for stage, method, arg_names, message, failure in SEARCH_STEPS:
+                if not _checkpoint(step, cancel_event, stage, message.format(st=search_type)):
+                    logger.info(f"Job cancelled at {stage} for {search_type}")
+                    return search_type, None
+                started = time.perf_counter()
+                succeeded = getattr(scraper, method)(*[step_args[name] for name in arg_names])
+                logger.info(f"{search_type} {stage} step took {time.perf_counter() - started:.2f}s")
+                if not succeeded:
+                    logger.error(f"{failure.format(st=search_type)}, skipping")
+                    return search_type, None
+            
+            if capture_api:
+                api_client.save_capture(scraper.driver, api_client.CAPTURE_FILE.replace('.json', f'_{PREFIX_MAP[search_type]}.json'))
+            
+            # Record the file export_to_csv saw finish downloading. last_download is only ever set
+            # from DownloadWatcher.wait_for_file, so it is a confirmed-complete file and safe to cache
+            file_path = scraper.last_download
+            if file_path:
+                logger.info(f"Added file for {search_type}: {os.path.basename(file_path)}")
+                csv_cache.put(key, file_path)
+                report(search_type, 'done', f"{search_type} data downloaded.")
+            return search_type, file_path
+    
+    except Exception as e:
+        logger.error(f"An error occurred during {search_type} search: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return search_type, None
 
 
 def scrape_rpdata(locations=None, property_types=None, min_floor_area="Min", max_floor_area="Max", 
-                  headless=False, progress_callback=None, is_cancelled=None, download_dir=None):
+                  headless=False, progress_callback=None, is_cancelled=None, download_dir=None,
+                  cancel_event=None):
     """
     Scrape RP Data with consistent progress reporting and robust cancellation checking.
     
@@ -26,26 +399,118 @@ def scrape_rpdata(locations=None, property_types=None, min_floor_area="Min", max
         max_floor_area: Maximum floor area requirement  
         headless: Whether to run browser in headless mode
         progress_callback: Function to report progress (percentage, message)
-        is_cancelled: Function that returns True if job should be cancelled
-        download_dir: Directory to save downloaded files
+        is_cancelled: Legacy function that returns True if job should be cancelled;
+            checked before login and before completing (pass cancel_event to cancel in between)
+        download_dir: Directory to save downloaded files (defaults to ./downloads)
+        cancel_event: threading.Event that is set when the job should be cancelled
+    
+    Each search type runs concurrently on its own pooled driver (up to
+    RPDATA_SEARCH_WORKERS at once) and downloads into its own subdirectory,
+    so exports can't collide. Workers close their scrapers when done.
     
     Returns:
-        Tuple of (result_files dict, scraper instance) or (empty dict, None) if cancelled
+        Tuple of (result_files dict, None, cancelled). If cancelled is True,
+        result_files holds the searches that had already finished
     """
-    # Default functions if none provided
+    # Default function if none provided
     if progress_callback is None:
-        def progress_callback(percentage, message):
-            pass
-            return True
+        progress_callback = _noop_progress
     
-    if is_cancelled is None:
-        def is_cancelled():
-            return False
+    # Validate the floor areas once here rather than re-parsing them in every search
+    try:
+        min_floor_area = coerce_floor_area(min_floor_area, FloorArea.MIN)
+        max_floor_area = coerce_floor_area(max_floor_area, FloorArea.MAX)
+    except ValueError as e:
+        logger.error(f"Invalid floor area filter: {e}")
+        return {}, None, False
+    
+    # Resolve and handshake with RP Data while the drivers are still starting
+    warm_thread = threading.Thread(target=_warm_connection)
+    warm_thread.daemon = True
+    warm_thread.start()
+    
+    # The hot path only ever checks cancel_event; it is also set when the callback returns False
+    if cancel_event is None:
+        cancel_event = threading.Event()
+    
+    # Deliver progress from a background thread so a slow callback never stalls the browser.
+    # A False return from the callback sets cancel_event, which the next update reports.
+    # The queue holds a single update: a newer one replaces any the emitter hasn't picked up yet.
+    original_callback = progress_callback
+    progress_q = queue.Queue(maxsize=1)
+    
+    def drain_progress():
+        highest_percentage_seen = 0
+        last_sent = 0.0
+        stopping = False
+        while not stopping:
+            update = progress_q.get()
+            if update is None:
+                break
+            percentage, message = update
+            # Coalesce bursts: hold an update until PROGRESS_DEBOUNCE has passed since the last one,
+            # delivering whatever newer update replaced it meanwhile. Job milestones go out at once.
+            wait = PROGRESS_DEBOUNCE - (time.monotonic() - last_sent)
+            if wait > 0 and percentage not in MILESTONE_PERCENTAGES:
+                time.sleep(wait)
+                try:
+                    newer = progress_q.get_nowait()
+                    if newer is None:
+                        # Shutting down - deliver the held update, then stop
+                        stopping = True
+                    else:
+                        percentage, message = newer
+                except queue.Empty:
+                    pass
+            # Keep progress strictly increasing even if updates are queued out of order
+            if isinstance(percentage, (int, float)) and percentage <= highest_percentage_seen:
+                continue
+            highest_percentage_seen = max(highest_percentage_seen, percentage or 0)
+            last_sent = time.monotonic()
+            try:
+                if original_callback(percentage, message) is False:
+                    cancel_event.set()
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+    
+    progress_thread = threading.Thread(target=drain_progress)
+    progress_thread.daemon = True
+    progress_thread.start()
+    
+    # Last percentage posted; updates that don't move it forward are never queued
+    last_posted = [-1]
+    post_lock = threading.Lock()
+    
+    def progress_callback(percentage, message):
+        """Post a progress update without blocking; returns False once the callback has asked to cancel."""
+        with post_lock:
+            if percentage <= last_posted[0]:
+                return not cancel_event.is_set()
+            last_posted[0] = percentage
+        while True:
+            try:
+                progress_q.put_nowait((percentage, message))
+                break
+            except queue.Full:
+                # Drop the stale update - only the latest progress is worth delivering
+                try:
+                    progress_q.get_nowait()
+                except queue.Empty:
+                    pass
+        return not cancel_event.is_set()
+    
+    # A legacy is_cancelled callable is only asked at the start and end of the job; in between,
+    # cancellation arrives through cancel_event or through progress_callback returning False
     
-    # Set up download directory
+    # Set up download directory - ./downloads unless the caller gives one. With
+    # RPDATA_TMPFS_DOWNLOADS=1 exports are staged on tmpfs and moved there at the end.
     if download_dir is None:
         download_dir = os.path.join(os.getcwd(), "downloads")
-    os.makedirs(download_dir, exist_ok=True)
+    staging_dir = None
+    persistent_dir = download_dir
+    ensure_dir(download_dir)
+    if os.environ.get('RPDATA_TMPFS_DOWNLOADS') == '1':
+        staging_dir = download_dir = _make_staging_dir()
     
     # Default values
     if locations is None:
@@ -53,224 +518,105 @@ def scrape_rpdata(locations=None, property_types=None, min_floor_area="Min", max
     if property_types is None:
         property_types = ["Business", "Commercial"]
     
-    scraper = None
     result_files = {}
     
-    # Define exact progress milestones that match main.py and app.py
-    PROGRESS_MILESTONES = {
-        'start': 5,
-        'login_start': 8,
-        'login_complete': 15,
-        'rent_start': 20,
-        'rent_complete': 45,
-        'sale_start': 50,
-        'sale_complete': 75,
-        'sales_start': 78,
-        'sales_complete': 90
-    }
+    # Each search type moves through SEARCH_SUBSTEPS; overall progress is looked up in JOB_PROGRESS
+    search_stage = {search_type: 'start' for search_type in SEARCH_TYPES}
+    progress_lock = threading.Lock()
     
-    # Define sub-steps within each search type as absolute percentages
-    # This ensures monotonic progress without any backwards movement
-    def get_search_milestones(search_type):
-        """Get absolute progress milestones for a specific search type."""
-        if search_type == 'For Rent':
-            return {
-                'start': PROGRESS_MILESTONES['rent_start'],
-                'locations': PROGRESS_MILESTONES['rent_start'] + 5,    # 25%
-                'filters': PROGRESS_MILESTONES['rent_start'] + 10,     # 30%
-                'selection': PROGRESS_MILESTONES['rent_start'] + 15,   # 35%
-                'export': PROGRESS_MILESTONES['rent_complete']         # 45%
-            }
-        elif search_type == 'For Sale':
-            return {
-                'start': PROGRESS_MILESTONES['sale_start'],
-                'locations': PROGRESS_MILESTONES['sale_start'] + 5,    # 55%
-                'filters': PROGRESS_MILESTONES['sale_start'] + 10,     # 60%
-                'selection': PROGRESS_MILESTONES['sale_start'] + 15,   # 65%
-                'export': PROGRESS_MILESTONES['sale_complete']         # 75%
-            }
-        elif search_type == 'Sales':
-            return {
-                'start': PROGRESS_MILESTONES['sales_start'],
-                'locations': PROGRESS_MILESTONES['sales_start'] + 3,   # 81%
-                'filters': PROGRESS_MILESTONES['sales_start'] + 6,     # 84%
-                'selection': PROGRESS_MILESTONES['sales_start'] + 9,   # 87%
-                'export': PROGRESS_MILESTONES['sales_complete']        # 90%
-            }
-        else:
-            # Fallback for any other search type
-            return {
-                'start': 0,
-                'locations': 25,
-                'filters': 50,
-                'selection': 75,
-                'export': 100
-            }
+    def report(search_type, stage, message):
+        """Thread-safe progress from a search worker, mapped onto the rent_start..sales_complete range."""
+        if stage == 'login':
+            return progress_callback(PROGRESS_MILESTONES['login_complete'], message)
+        with progress_lock:
+            if SEARCH_SUBSTEPS[stage] > SEARCH_SUBSTEPS[search_stage[search_type]]:
+                search_stage[search_type] = stage
+            percentage = JOB_PROGRESS[tuple(search_stage[st] for st in SEARCH_TYPES)]
+        return progress_callback(percentage, message)
     
     try:
-        # Check cancellation at the very start
-        if is_cancelled():
-            logger.info("Job cancelled before starting scraper")
-            return {}, None
-        
-        # Progress update - login start
-        if progress_callback(PROGRESS_MILESTONES['login_start'], "Logging into RP Data...") is False:
+        # Check cancellation at the very start, then report login start
+        if (is_cancelled is not None and is_cancelled()) or not _checkpoint(
+                progress_callback, cancel_event, PROGRESS_MILESTONES['login_start'], "Logging into RP Data..."):
             logger.info("Job cancelled before login")
-            return {}, None
-        
-        # Initialize scraper
-        scraper = RPDataScraper(headless=headless, download_dir=download_dir)
+            return result_files, None, True
         
-        # Attempt login
-        login_success = scraper.login("busihealth", "Busihealth123")
-        if not login_success:
-            logger.error("Login failed, aborting")
-            scraper.close()
-            return result_files, None
+        # Try the direct HTTP path first when enabled, falling back to the browser
+        if os.environ.get('RPDATA_USE_API') == '1':
+            api = api_client.RPDataAPI.from_config()
+            if api and api.login(*RPDATA_CREDENTIALS):
+                # Export into scratch space and keep the files only if every search came through,
+                # so a browser fallback never leaves untracked API copies in the job folder
+                api_dir = tempfile.mkdtemp(prefix="rpdata-api-")
+                try:
+                    api_files = api.export_all(SEARCH_TYPES, PREFIX_MAP, locations, property_types,
+                                               min_floor_area, max_floor_area, api_dir)
+                    if len(api_files) == len(SEARCH_TYPES):
+                        _persist_downloads(api_files, api_dir, download_dir)
+                        progress_callback(PROGRESS_MILESTONES['sales_complete'], "All RP Data downloads completed.")
+                        result_files.update(api_files)
+                        return result_files, None, False
+                finally:
+                    shutil.rmtree(api_dir, ignore_errors=True)
+            logger.warning("RP Data API export unavailable, falling back to browser")
         
-        # Check cancellation after login
-        if is_cancelled() or progress_callback(PROGRESS_MILESTONES['login_complete'], "Login successful. Preparing to search...") is False:
-            logger.info("Job cancelled after login")
-            scraper.close()
-            return {}, None
-
-        # Define search configurations in order
-        search_configs = [
-            {'name': 'For Rent'},
-            {'name': 'For Sale'}, 
-            {'name': 'Sales'}
-        ]
-
-        # Process each search type
-        for search_config in search_configs:
-            search_type = search_config['name']
-            milestones = get_search_milestones(search_type)
+        # Run the search types concurrently, each on its own driver and download directory,
+        # sharing one login between them
+        session = _SharedSession()
+        max_workers = int(os.environ.get('RPDATA_SEARCH_WORKERS', str(len(SEARCH_TYPES))))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_one_search, spec.name, locations, property_types, min_floor_area, max_floor_area,
+                    headless, os.path.join(download_dir, spec.prefix),
+                    SEARCH_MILESTONES[spec.name], report, cancel_event, session
+                )
+                for spec in SEARCH_SPECS
+            ]
             
-            # Check cancellation before starting this search type
-            if is_cancelled():
-                logger.info(f"Job cancelled before {search_type} search")
-                scraper.close()
-                return result_files, None
-            
-            # Start this search type - progress update
-            if progress_callback(milestones['start'], f"Starting {search_type} search...") is False:
-                logger.info(f"Job cancelled before {search_type} search")
-                scraper.close()
-                return result_files, None
-
-            logger.info(f"\n===== STARTING SEARCH TYPE: {search_type} =====\n")
-
-            # Select search type
-            if not scraper.select_search_type(search_type):
-                logger.error(f"Failed to select search type: {search_type}, skipping")
-                continue
-
-            # Check cancellation after selection
-            if is_cancelled():
-                logger.info(f"Job cancelled after selecting {search_type}")
-                scraper.close()
-                return result_files, None
-
-            # Search locations with progress update
-            if progress_callback(milestones['locations'], f"Searching locations for {search_type}...") is False:
-                logger.info(f"Job cancelled during {search_type} location search")
-                scraper.close()
-                return result_files, None
-
-            if not scraper.search_locations(locations, search_type):
-                logger.error(f"Failed to search locations for: {search_type}, skipping")
-                continue
-
-            # Check cancellation after locations
-            if is_cancelled():
-                logger.info(f"Job cancelled after locations for {search_type}")
-                scraper.close()
-                return result_files, None
-
-            # Apply filters with progress update
-            if progress_callback(milestones['filters'], f"Applying filters for {search_type}...") is False:
-                logger.info(f"Job cancelled during {search_type} filters")
-                scraper.close()
-                return result_files, None
-
-            if not scraper.apply_filters(property_types, min_floor_area, max_floor_area, progress_callback, milestones, search_type):
-                logger.error(f"Failed to apply filters for: {search_type}, skipping")
-                continue
-
-            # Check cancellation after filters
-            if is_cancelled():
-                logger.info(f"Job cancelled after filters for {search_type}")
-                scraper.close()
-                return result_files, None
-
-            # Select results with progress update
-            if progress_callback(milestones['selection'], f"Selecting results for {search_type}...") is False:
-                logger.info(f"Job cancelled after filter for {search_type}")
-                scraper.close()
-                return result_files, None
-
-            if not scraper.select_all_results():
-                logger.error(f"Failed to select all results for: {search_type}, skipping")
-                continue
-
-            # Check cancellation after selection
-            if is_cancelled():
-                logger.info(f"Job cancelled after selection for {search_type}")
-                scraper.close()
-                return result_files, None
-
-            # Export data with progress update
-            if progress_callback(milestones['export'], f"Exporting {search_type} data...") is False:
-                logger.info(f"Job cancelled before export for {search_type}")
-                scraper.close()
-                return result_files, None
-
-            if not scraper.export_to_csv(search_type):
-                logger.error(f"Failed to export to CSV for: {search_type}, skipping")
-                continue
-
-            # Check cancellation after export
-            if is_cancelled():
-                logger.info(f"Job cancelled after export for {search_type}")
-                scraper.close()
-                return result_files, None
-
-            # Check for downloaded files
-            prefix_map = {
-                "Sales": "recentSaleExport",
-                "For Sale": "forSaleExport",
-                "For Rent": "forRentExport"
-            }
-            prefix = prefix_map.get(search_type)
-            downloaded_files = [f for f in os.listdir(scraper.download_dir) if f.startswith(prefix)]
-
-            if downloaded_files:
-                result_files[search_type] = os.path.join(scraper.download_dir, downloaded_files[0])
-                logger.info(f"Added file for {search_type}: {downloaded_files[0]}")
-
-            # Return to dashboard for next search (if not the last one)
-            if search_type != 'Sales':  # Sales is the last search type
-                if not scraper.return_to_dashboard():
-                    logger.error(f"Failed to return to dashboard after: {search_type}, aborting")
+            for future in as_completed(futures):
+                search_type, file_path = future.result()
+                if file_path:
+                    result_files[search_type] = file_path
+                
+                # Stop searches that haven't started; running ones check cancel_event between steps
+                if cancel_event.is_set():
+                    logger.info("Job cancelled during searches")
+                    for other in futures:
+                        other.cancel()
                     break
         
-        # Final check before completing
-        if is_cancelled():
+        # Leaving the executor waited for searches already running; keep the exports any of them
+        # finished after the cancel so a cancelled job still hands back all of its completed work
+        for future in futures:
+            if future.done() and not future.cancelled():
+                search_type, file_path = future.result()
+                if file_path:
+                    result_files.setdefault(search_type, file_path)
+        
+        # Final check before completing - the legacy callable is asked directly so no poll lag slips through
+        if cancel_event.is_set() or (is_cancelled is not None and is_cancelled()):
             logger.info("Job cancelled before final completion")
-            scraper.close()
-            return result_files, None
+            return result_files, None, True
         
         # All searches completed - final progress update
         progress_callback(PROGRESS_MILESTONES['sales_complete'], "All RP Data downloads completed.")
-        return result_files, scraper
+        return result_files, None, False
 
     except Exception as e:
         logger.error(f"An error occurred during scraping: {e}")
         import traceback
         logger.error(traceback.format_exc())
-        if scraper:
-            scraper.close()
-        return result_files, None
+        return result_files, None, cancel_event.is_set()
+    finally:
+        if staging_dir:
+            _persist_downloads(result_files, staging_dir, persistent_dir)
+        # Wait for the last update to land before the caller reports anything newer
+        try:
+            progress_q.put(None, timeout=10)
+        except queue.Full:
+            logger.warning("Progress emitter is stuck, not waiting for it")
+        progress_thread.join(timeout=10)
 
 
 if __name__ == "__main__":
@@ -285,7 +631,7 @@ if __name__ == "__main__":
         print(f"Progress: {percentage}% - {message}")
         return True
     
-    result_files, scraper = scrape_rpdata(
+    result_files, _, _ = scrape_rpdata(
         locations=locations,
         property_types=property_types,
         min_floor_area=min_floor,
@@ -294,8 +640,5 @@ if __name__ == "__main__":
         progress_callback=test_progress
     )
     
-    if scraper:
-        scraper.close()
-    
     logger.info("Scraping completed")
     logger.info(f"Result files: {result_files}")
\ No newline at end of file
@@ -59,23 +59,306 @@ Each method can also be called individually for more granular control over the p
 """
 
 import os
+import json
 import time
+from types import MappingProxyType
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
 
 import sys
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from rpdata_base import RPDataBase, logger
+# Add this directory to the path if it isn't already there
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.append(current_dir)
+from rpdata_base import (RPDataBase, logger, SearchSpec, SEARCH_SPECS, SEARCH_TYPES, PREFIX_MAP, FloorArea,
+                         coerce_floor_area)
 
 # Define constants for filter results to avoid string comparison issues
 FILTER_NO_RESULTS = 0
 FILTER_SUCCESS = 1
 FILTER_ERROR = 2
 
+# The dashboard's search prompt, and anything that only shows once logged in
+DASHBOARD_XPATH = "//div[contains(text(), 'Start your search here')]"
+LOGGED_IN_XPATH = DASHBOARD_XPATH + " | //a[contains(@class, 'cl-logo')]"
+DASHBOARD_READY_JS = (
+    f"return document.evaluate(\"boolean({DASHBOARD_XPATH})\", document, null, "
+    "XPathResult.BOOLEAN_TYPE, null).booleanValue;"
+)
+# True if any logged-in indicator is rendered, checked in the page rather than per element
+LOGGED_IN_JS = """
+var nodes = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (var i = 0; i < nodes.snapshotLength; i++) {
+    if (nodes.snapshotItem(i).getClientRects().length > 0) return true;
+}
+return false;
+"""
+
+# Any entry in the location search's suggestion dropdown
+DROPDOWN_OPTION = (By.CSS_SELECTOR, "li[role*='option']")
+
+# Wait conditions used on every search, built once. They only hold a locator, so a
+# single instance can be shared by every scraper and thread.
+SEARCH_TYPE_RADIOS_PRESENT = EC.presence_of_element_located(
+    (By.CSS_SELECTOR, "input[type='radio'][name='row-radio-buttons-group']"))
+DROPDOWN_VISIBLE = EC.visibility_of_element_located(DROPDOWN_OPTION)
+DROPDOWN_CLOSED = EC.invisibility_of_element_located(DROPDOWN_OPTION)
+LISTBOX_CLOSED = EC.invisibility_of_element_located((By.CSS_SELECTOR, "ul[role='listbox']"))
+
+# Selectors tried in priority order by wait_for_any_xpath, which checks them all in one
+# browser-side wait rather than a WebDriver round-trip (and timeout) per selector.
+# Plain attribute matches are CSS (run by querySelectorAll, much cheaper than XPath on
+# the results page); XPath is kept where text() or a parent step is needed.
+SEARCH_FIELD_SELECTORS = (
+    "input[placeholder*='Search for an address']",
+    "input[id*='crux-multi-locality-search']",
+    "div[class*='search-bar-container'] input",
+    "div#crux-search-bar input",
+    "input[placeholder*='Search']",
+    "input[type*='text'][class*='MuiInputBase-input']",
+)
+SEARCH_AGAIN_SELECTORS = (
+    "input[placeholder*='Search for a suburb']",
+    "div[class*='MuiAutocomplete-root'] input",
+    "div[data-testid='searchbar'] input",
+    "input[aria-label*='Search']",
+    "input[type*='text'][class*='MuiInputBase-input']",
+    "input[placeholder*='Search']",
+)
+DROPDOWN_OPTION_SELECTORS = (
+    "li[role*='option'][data-option-index='0']",
+    "li[id*='crux-multi-locality-search-option-0']",
+    "li[class*='MuiAutocomplete-option'][data-option-index='0']",
+    "li[class*='MuiAutocomplete-option']",
+    "li[role*='option']",
+)
+SEARCH_BUTTON_SELECTORS = (
+    "button[class*='search-btn']",
+    "//button[contains(@class, 'button-primary')]//img[contains(@alt, 'Search Button')]/..",
+    "button[type*='button'][class*='search-btn']",
+    "button[class*='MuiButton-contained']",
+    "button[class*='MuiButtonBase-root']",
+)
+FILTER_BUTTON_SELECTORS = (
+    "button[data-testid*='filter-modal']",
+    "//button[contains(text(), 'Filters')]",
+    "button[class*='crux-search-filters__container__row__actions__button--filters']",
+    "//button[contains(@class, 'MuiButton-contained')][contains(text(), 'Filter')]",
+)
+FLOOR_AREA_SELECTORS = (
+    "//h6[contains(text(), 'Floor Area')]",
+    "//div[contains(text(), 'Floor Area')]",
+    "//label[contains(text(), 'Floor Area')]",
+)
+PROPERTY_SECTION_SELECTORS = (
+    "//h6[contains(@class, 'MuiTypography-subtitle2')]/span[text()='Property Type']/..",
+    "div[class*='list-box--property-type'] h6",
+    "div[class*='list-box--property-type']",
+    "//h6[contains(text(), 'Property Type')]/..",
+)
+APPLY_BUTTON_SELECTORS = (
+    "button[data-testid='apply-filters']",
+    "//button[contains(text(), 'Show')]",
+    "button[class*='MuiButton-containedPrimary']",
+    "button[class*='MuiButton-disableElevation']",
+    "//button[contains(text(), 'Apply')]",
+    "//button[contains(text(), 'Filter')]",
+)
+
+# Explicit zero-results messages on the results page, as one union query
+NO_RESULTS_XPATH = (
+    "//div[text()='No results found']"
+    " | //div[text()='No properties found']"
+    " | //div[contains(text(), '0 properties') and not(contains(text(), 'of'))]"
+    " | //div[contains(text(), '0 result') and not(contains(text(), 'of'))]"
+)
+# Probes the results page for every no-results indicator in one call. Takes NO_RESULTS_XPATH
+# and returns [kind, text] for the first visible hit - "no-matches", "indicator", or "count"
+# with the results count text - or null if none is on the page.
+NO_RESULTS_PROBE_JS = """
+function visible(xpath) {
+    var nodes = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < nodes.snapshotLength; i++) {
+        if (nodes.snapshotItem(i).getClientRects().length > 0) return nodes.snapshotItem(i);
+    }
+    return null;
+}
+if (visible("//div[contains(text(), 'No matching properties found')]")) return ['no-matches', ''];
+var el = visible(arguments[0]);
+if (el) return ['indicator', el.innerText];
+var count = document.querySelector("div[class*='result-count-main']");
+return count ? ['count', count.innerText] : null;
+"""
+SELECT_ALL_CHECKBOX_SELECTORS = (
+    "input[class='PrivateSwitchBase-input css-1m9pwf3']",
+    "span[data-testid='multi-select-check-icon'] input[type='checkbox']",
+    "div[data-testid='rapid-multi-select-counter'] input[type='checkbox']",
+    "span[data-testid='multi-select-check-icon']",
+)
+
+# Clicks the "Select All" option of the select-all dropdown: input#all-option by id first, as
+# that's a direct lookup, then the middle label or middle radio input. Returns a description of
+# what was clicked, or null.
+CLICK_SELECT_ALL_OPTION_JS = """
+var all = document.getElementById('all-option');
+if (all) { all.click(); return 'all-option'; }
+var labels = document.querySelectorAll("span[data-testid='single-select-checkbox-label']");
+if (labels.length >= 3) { labels[1].click(); return labels[1].textContent.trim(); }
+var radios = document.querySelectorAll("input[data-testid='single-select-checkbox']");
+if (radios.length >= 3) { radios[1].click(); return 'middle radio input'; }
+return null;
+"""
+
+CORELOGIC_LOGO_SELECTORS = (
+    "div[class='logo'] > a[class='cl-logo']",
+    "a[class='cl-logo']",
+    "//img[@class='cl-logo-img' and @alt='CoreLogic']/..",
+    "//img[@alt='CoreLogic']/..",
+)
+HOME_LINK_SELECTORS = (
+    "a[class*='cl-logo']",
+    "//img[contains(@alt, 'CoreLogic')]/..",
+    "img[alt*='CoreLogic']",
+    "a[href*='/dashboard']",
+    "a[class*='home']",
+    "div[class='logo'] > a[class='cl-logo']",
+)
+
+# Reports the export button's state in one call instead of find + is_displayed + is_enabled
+EXPORT_BUTTON_STATE_JS = """
+var button = document.querySelector("button[data-testid='export-to-csv-button']");
+return {
+    button: button,
+    present: !!button,
+    visible: !!button && button.getClientRects().length > 0,
+    enabled: !!button && !button.disabled
+};
+"""
+
+# Ticks every visible, unchecked checkbox in the export dialog, then makes sure the disclaimer
+# acknowledgement is ticked. Returns whether it is, or null if the disclaimer isn't on the page.
+CHECK_EXPORT_DIALOG_JS = """
+var checkboxes = document.querySelectorAll('input[type="checkbox"]:not(:checked)');
+for (var i = 0; i < checkboxes.length; i++) {
+    if (checkboxes[i].offsetParent !== null) checkboxes[i].click();
+}
+var ack = document.querySelector("input[data-testid='export-disclaimer-checkbox']");
+if (!ack) return null;
+if (!ack.checked) ack.click();
+return ack.checked;
+"""
+
+# Scrolls to the Floor Area heading and returns the Min/Max comboboxes of its nearest
+# enclosing container, or null if no ancestor holds them
+FLOOR_AREA_INPUTS_JS = """
+var el = arguments[0];
+el.scrollIntoView(true);
+while (el && !el.querySelector('input[role="combobox"]')) {
+    el = el.parentElement;
+}
+return el ? Array.from(el.querySelectorAll('input[role="combobox"]')) : null;
+"""
+
+# Replaces a combobox's value and commits it with Enter, as click/clear/send_keys did but in
+# one call. The native setter is used so React registers the change.
+FILL_COMBOBOX_JS = """
+var el = arguments[0];
+el.focus();
+Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set.call(el, arguments[1]);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', keyCode: 13, which: 13, bubbles: true}));
+"""
+
+# Scrolls to the Property Type section, then pairs each checkbox with its label and clicks
+# the ones whose state differs from the wanted types. Returns [label, was_checked, toggled]
+# per property type, or null if the list isn't on the page.
+SET_PROPERTY_TYPES_JS = """
+var wanted = arguments[1];
+arguments[0].scrollIntoView(true);
+var container = document.querySelector("div[class*='list-box--property-type']");
+if (!container) return null;
+var boxes = container.querySelectorAll("input[type='checkbox']");
+var labels = container.querySelectorAll("span[class*='MuiFormControlLabel-label']");
+var result = [];
+for (var i = 0; i < labels.length && i < boxes.length; i++) {
+    var text = labels[i].textContent.trim();
+    if (!text) continue;
+    var checked = boxes[i].checked;
+    var toggle = checked !== (wanted.indexOf(text) !== -1);
+    if (toggle) boxes[i].click();
+    result.push([text, checked, toggle]);
+}
+return result;
+"""
+
+# Value of each search type's radio in the dashboard's search type group
+SEARCH_TYPE_RADIO_VALUES = MappingProxyType({
+    "Sales": "recentSale",
+    "For Sale": "forSale",
+    "For Rent": "forRent",
+})
+
+
+def xpath_literal(text):
+    """Quote text for use in an XPath expression, including text containing quotes."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+def location_option_xpath(location):
+    """Return an XPath for dropdown options whose text contains location, ignoring case."""
+    return (
+        "//li[contains(@role, 'option')][contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', "
+        f"'abcdefghijklmnopqrstuvwxyz'), {xpath_literal(location.strip().lower())})]"
+    )
+
+
+def search_type_selectors(search_type):
+    """
+    Return the selectors that can select search_type, most specific first.
+
+    The radio is matched on its value by CSS, so no attribute is read back per
+    radio; the text matches (label, span parent, button) are one union XPath.
+    """
+    literal = xpath_literal(search_type)
+    return (
+        f"input[type='radio'][name='row-radio-buttons-group'][value='{SEARCH_TYPE_RADIO_VALUES.get(search_type, '')}']",
+        f"//label[contains(., {literal})]"
+        f" | //span[contains(text(), {literal})]/.."
+        f" | //button[contains(text(), {literal})]",
+    )
+
+
+# Built once per search type rather than on every selection
+SEARCH_TYPE_SELECTORS = MappingProxyType({name: search_type_selectors(name) for name in SEARCH_TYPES})
+
+
+def load_search_urls():
+    """
+    Read the search type deep links from RPDATA_SEARCH_URLS.
+
+    A malformed value is logged and ignored, so the scraper falls back to the UI flow.
+    """
+    try:
+        urls = json.loads(os.environ.get('RPDATA_SEARCH_URLS', '{}'))
+        if not isinstance(urls, dict):
+            raise ValueError("expected a JSON object")
+        return urls
+    except ValueError as e:
+        logger.warning(f"Ignoring invalid RPDATA_SEARCH_URLS: {e}")
+        return {}
+
+
 class RPDataScraper(RPDataBase):
+    # Deep links that open each search type directly, captured from DevTools and supplied as
+    # JSON in RPDATA_SEARCH_URLS, e.g. {"For Rent": "https://rpp.corelogic.com.au/..."}
+    _search_urls = load_search_urls()
+    
     def run_search(self, username, password, search_type, locations, property_types, min_floor_area="Min", max_floor_area="Max"):
         """
         Run a complete search flow from login to export.
@@ -84,33 +367,27 @@ class RPDataScraper(RPDataBase):
         logger.info(f"===== STARTING COMPLETE SEARCH FLOW: {search_type} =====")
         
         try:
+            min_floor_area = coerce_floor_area(min_floor_area, FloorArea.MIN)
+            max_floor_area = coerce_floor_area(max_floor_area, FloorArea.MAX)
+            
             # Login if needed
             if not self.is_logged_in():
                 if not self.login(username, password):
                     logger.error("Login failed, cannot proceed with search")
                     return None
             
-            # Add a brief pause after login to ensure the dashboard is loaded
-            time.sleep(0.75)
-            
             # Select the search type (Sales, For Sale, For Rent)
             if not self.select_search_type(search_type):
                 logger.error(f"Failed to select search type {search_type}, skipping")
                 self.return_to_dashboard()
                 return None
             
-            # Brief pause after selecting search type
-            time.sleep(1)
-            
             # Search for the specified locations
             if not self.search_locations(locations, search_type):
                 logger.error(f"Failed to search locations {locations}, skipping")
                 self.return_to_dashboard()
                 return None
             
-            # Brief pause after search to ensure results are loaded
-            time.sleep(1.5)
-            
             # Apply filters - now using enum-like constants instead of strings
             filter_result = self.apply_filters(property_types, min_floor_area, max_floor_area)
             
@@ -127,50 +404,31 @@ class RPDataScraper(RPDataBase):
             # We now know filter_result must be FILTER_SUCCESS
             logger.info("Filters applied successfully, proceeding to select results")
             
-            # Brief pause after applying filters
-            time.sleep(1)
-                
             # Select all results - check if there are any results
             if not self.select_all_results():
                 logger.info(f"No results found for search type {search_type} with the specified filters")
                 self.return_to_dashboard()
                 return None
             
-            # Brief pause after selecting results
-            time.sleep(1)
-            
             # Export to CSV
             if not self.export_to_csv(search_type):
                 logger.error("Failed to export to CSV")
                 self.return_to_dashboard()
                 return None
             
-            # Wait for the download to complete
-            time.sleep(5)
-            
             # Try to find the downloaded file
-            prefix_map = {
-                "Sales": "recentSaleExport",
-                "For Sale": "forSaleExport",
-                "For Rent": "forRentExport"
-            }
-            
-            prefix = prefix_map.get(search_type)
+            prefix = PREFIX_MAP.get(search_type)
             if not prefix:
                 logger.error(f"Unknown search type for file prefix: {search_type}")
                 self.return_to_dashboard()
                 return None
             
-            # Find the downloaded file
-            downloaded_files = [f for f in os.listdir(self.download_dir) if f.startswith(prefix)]
+            # Find the downloaded file (export_to_csv has already waited for it to finish)
+            file_path = self.last_download
             
-            if downloaded_files:
-                file_path = os.path.join(self.download_dir, downloaded_files[0])
+            if file_path:
                 logger.info(f"Search completed successfully, file saved at: {file_path}")
                 
-                # Brief wait before returning to dashboard
-                time.sleep(1)
-                
                 # Return to dashboard for next search
                 self.return_to_dashboard()
                 return file_path
@@ -184,41 +442,69 @@ class RPDataScraper(RPDataBase):
             # Try to return to dashboard even after an exception
             try:
                 self.return_to_dashboard()
-            except:
+            except Exception:
                 pass
             return None
     
     def is_logged_in(self):
         """Check if already logged in by looking for dashboard elements."""
+        # Once this scraper has seen the dashboard the session is known to be good
+        if self._logged_in:
+            return True
         try:
-            # Look for elements that indicate we're already on the dashboard
-            dashboard_indicators = [
-                "//div[contains(text(), 'Start your search here')]",
-                "//a[contains(@class, 'cl-logo')]"
-            ]
-            
-            for indicator in dashboard_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, indicator)
-                    if element.is_displayed():
-                        logger.info("Already logged in to RP Data")
-                        return True
-                except:
-                    continue
+            # Both indicators and their visibility in one in-page check
+            if self.run_js(LOGGED_IN_JS, LOGGED_IN_XPATH):
+                logger.info("Already logged in to RP Data")
+                self._logged_in = True
+                return True
             
             return False
         except Exception as e:
             logger.warning(f"Error checking login status: {e}")
             return False
     
+    def on_dashboard(self):
+        """
+        Return True if the dashboard's search prompt is on the page.
+
+        The XPath is evaluated to a boolean in the page, so a single true/false
+        comes back instead of element references or the page_source DOM dump.
+        """
+        try:
+            found = bool(self.run_js(DASHBOARD_READY_JS))
+        except WebDriverException:
+            # CDP doesn't wait out a navigation the way execute_script does
+            return False
+        if found:
+            self._logged_in = True
+        return found
+    
+    def wait_for_dashboard(self, timeout=8):
+        """
+        Wait for the dashboard's search prompt, returning True once it shows.
+
+        The prompt is watched for in the page with a MutationObserver, so this
+        is one round-trip rather than an on_dashboard() call every poll. A full
+        page load aborts the in-page wait, in which case the rest of the
+        timeout is polled with on_dashboard().
+        """
+        deadline = time.time() + timeout
+        prompt, _ = self.wait_for_any_xpath((DASHBOARD_XPATH,), timeout=timeout)
+        if prompt is not None:
+            self._logged_in = True
+            return True
+        remaining = int(deadline - time.time())
+        if remaining < 1:
+            return False
+        return bool(self.wait_until(lambda driver: self.on_dashboard(), timeout=remaining))
+    
     def safe_navigate(self, url, max_retries=3, retry_delay=1.5):
         """Safely navigate to a URL with retries."""
         for attempt in range(max_retries):
             try:
                 logger.info(f"Navigating to: {url} (attempt {attempt+1}/{max_retries})")
+                # get() returns once the page load strategy is satisfied
                 self.driver.get(url)
-                # Brief wait for page to start loading
-                time.sleep(1)
                 return True
             except Exception as e:
                 logger.warning(f"Navigation error (attempt {attempt+1}): {e}")
@@ -227,7 +513,7 @@ class RPDataScraper(RPDataBase):
                     # Check if driver is still responsive
                     try:
                         self.driver.current_url  # Try to access a property to check if driver is alive
-                    except:
+                    except WebDriverException:
                         logger.error("WebDriver is no longer responsive, cannot retry navigation")
                         return False
                 else:
@@ -249,18 +535,17 @@ class RPDataScraper(RPDataBase):
                 logger.info("Cancellation detected during login navigation")
                 return False
             
-            # Brief wait for login page to load
-            time.sleep(1)
-            
-            # Log the body content after navigation - simplified
-            try:
-                body_element = self.driver.find_element(By.TAG_NAME, 'body')
-                logger.info("Page loaded successfully")
-            except Exception as e:
-                logger.error(f"Error getting body content: {e}")
+            # A persisted profile may still hold a valid session - skip the form if so.
+            # The wait returns the username field (as a list) or True for a live session.
+            landing = self.wait_until(
+                lambda driver: driver.find_elements(By.ID, "username") or self.is_logged_in(), timeout=8)
+            if landing is True:
+                logger.info("Existing session is still valid, skipping credential entry")
+                return True
+            logger.info("Page loaded successfully")
             
             # Find and fill username field
-            username_field = self.wait_and_find_element(By.ID, "username", timeout=8)
+            username_field = landing[0] if landing else self.wait_and_find_element(By.ID, "username", timeout=8)
             
             if username_field:
                 # Using moderate typing speed for reliability
@@ -301,26 +586,19 @@ class RPDataScraper(RPDataBase):
                 logger.error("Login button not found")
                 return False
             
-            # Brief wait for login to process
-            time.sleep(1)
-            
             # Wait for login to complete and redirect to dashboard
-            try:
-                logger.info("Waiting for dashboard...")
-                
-                # Reasonable timeout
-                WebDriverWait(self.driver, 10).until(
-                    lambda driver: "Start your search here" in driver.page_source
-                )
-                logger.info("Login successful - redirected to dashboard")
-                
-                # Brief wait to ensure dashboard is loaded
-                time.sleep(0.5)
-                
-                return True
-            except TimeoutException:
+            logger.info("Waiting for dashboard...")
+            
+            # Reasonable timeout, resolved as soon as the dashboard renders
+            if not self.wait_for_dashboard(timeout=10):
                 logger.error("Login appears to have failed - dashboard not loaded after timeout")
                 return False
+            logger.info("Login successful - redirected to dashboard")
+            
+            # Wait for the search type radios to render rather than a fixed pause
+            self.wait_until(SEARCH_TYPE_RADIOS_PRESENT, timeout=2)
+            
+            return True
                     
         except Exception as e:
             logger.error(f"Login failed with exception: {e}")
@@ -330,118 +608,31 @@ class RPDataScraper(RPDataBase):
         """Select the search type (Sales, For Sale, For Rent)."""
         logger.info(f"===== SELECTING SEARCH TYPE: {search_type} =====")
         
+        # Jump straight to the search type's page if we have a deep link for it
+        if search_type in self._search_urls and self.open_search_url(search_type):
+            return True
+        
         try:
             # Wait to make sure we're on the dashboard
-            try:
-                WebDriverWait(self.driver, 3).until(
-                    lambda driver: "Start your search here" in driver.page_source
-                )
+            if self.wait_for_dashboard(timeout=3):
                 logger.info("Dashboard confirmed, proceeding with search type selection")
-            except:
+            else:
                 logger.warning("Could not confirm dashboard page, but proceeding anyway")
-                # Brief wait to see if page finishes loading
-                time.sleep(1)
-            
-            # Try multiple approaches to find and select the search type
-            
-            # Approach 1: Try to find radio buttons by name
-            try:
-                radio_buttons = self.driver.find_elements(By.XPATH, "//input[@type='radio' and @name='row-radio-buttons-group']")
-                logger.info(f"Found {len(radio_buttons)} radio buttons by name")
-                
-                for radio in radio_buttons:
-                    value = radio.get_attribute("value")
-                    if (search_type == "Sales" and value == "recentSale") or \
-                       (search_type == "For Sale" and value == "forSale") or \
-                       (search_type == "For Rent" and value == "forRent"):
-                        self.safe_click(radio)
-                        logger.info(f"Selected search type by radio button: {search_type}")
-                        # Brief delay
-                        self.random_delay(0.3, 0.5)
-                        return True
-            except Exception as e:
-                logger.warning(f"Error finding radio buttons by name: {e}")
-            
-            # Approach 2: Try to find by text
-            try:
-                # Different specific XPath for different search types to be more targeted
-                if search_type == "Sales":
-                    type_elements = self.driver.find_elements(By.XPATH, "//span[text()='Sales' or text()='Recent Sales' or contains(text(), 'Sales')]")
-                elif search_type == "For Sale":
-                    type_elements = self.driver.find_elements(By.XPATH, "//span[text()='For Sale' or contains(text(), 'For Sale')]")
-                elif search_type == "For Rent":
-                    type_elements = self.driver.find_elements(By.XPATH, "//span[text()='For Rent' or contains(text(), 'For Rent')]")
-                else:
-                    type_elements = self.driver.find_elements(By.XPATH, f"//span[contains(text(), '{search_type}')]")
-                
-                logger.info(f"Found {len(type_elements)} elements with text matching {search_type}")
-                
-                for element in type_elements:
-                    if element.is_displayed():
-                        # Try to click the element
-                        try:
-                            self.safe_click(element)
-                            logger.info(f"Clicked on element with text: {element.text}")
-                            # Brief delay
-                            self.random_delay(0.3, 0.5)
-                            return True
-                        except Exception as e:
-                            logger.warning(f"Failed to click element with text '{element.text}': {e}")
-                            
-                            # Try to find parent element that might be clickable
-                            try:
-                                parent = element.find_element(By.XPATH, "./..")
-                                self.safe_click(parent)
-                                logger.info(f"Clicked on parent of element with text: {element.text}")
-                                # Brief delay
-                                self.random_delay(0.3, 0.5)
-                                return True
-                            except Exception as e2:
-                                logger.warning(f"Failed to click parent of element with text '{element.text}': {e2}")
-            except Exception as e:
-                logger.warning(f"Error finding search type by text: {e}")
-            
-            # Approach 3: Try to find by label and its associated input
-            try:
-                labels = self.driver.find_elements(By.XPATH, f"//label[contains(., '{search_type}')]")
-                logger.info(f"Found {len(labels)} labels containing text '{search_type}'")
-                
-                for label in labels:
-                    if label.is_displayed():
-                        self.safe_click(label)
-                        logger.info(f"Selected search type by label: {search_type}")
-                        # Brief delay
-                        self.random_delay(0.3, 0.5)
-                        return True
-            except Exception as e:
-                logger.warning(f"Error finding search type by label: {e}")
-            
-            # Approach 4: More general approach looking for ANY visible element
-            try:
-                xpath_patterns = [
-                    f"//span[contains(text(), '{search_type}')]/..",
-                    f"//div[contains(text(), '{search_type}')]",
-                    f"//button[contains(text(), '{search_type}')]",
-                    f"//*[contains(@role, 'button')][contains(text(), '{search_type}')]",
-                    f"//*[contains(@class, 'button')][contains(text(), '{search_type}')]"
-                ]
-                
-                for pattern in xpath_patterns:
-                    elements = self.driver.find_elements(By.XPATH, pattern)
-                    logger.info(f"Found {len(elements)} elements with pattern {pattern}")
-                    
-                    for element in elements:
-                        if element.is_displayed():
-                            try:
-                                self.safe_click(element)
-                                logger.info(f"Selected search type using pattern {pattern}")
-                                # Brief delay
-                                self.random_delay(0.3, 0.5)
-                                return True
-                            except Exception as e:
-                                logger.warning(f"Failed to click element using pattern {pattern}: {e}")
-            except Exception as e:
-                logger.warning(f"Error with general approach for finding search type: {e}")
+                # Give a slow page a moment to render the search type radios
+                self.wait_until(SEARCH_TYPE_RADIOS_PRESENT, timeout=1)
+            
+            # One round-trip for every candidate: the radio for this type first, then its
+            # label, the parent of a matching span, or a button. Visibility is checked in
+            # the page, so the first element returned is one that can be clicked.
+            selectors = SEARCH_TYPE_SELECTORS.get(search_type) or search_type_selectors(search_type)
+            element, _ = self.wait_for_any_xpath(selectors, timeout=2)
+            prev_url = self.driver.current_url
+            if element and self.safe_click(element):
+                logger.info(f"Selected search type: {search_type}")
+                # Continue as soon as the page moves on or the location search bar is up
+                self.wait_until(lambda driver: driver.current_url != prev_url or driver.find_elements(
+                    By.CSS_SELECTOR, "input[placeholder*='Search for an address']"), timeout=2)
+                return True
             
             # If we get here, we couldn't find the search type
             logger.error(f"Could not find search type: {search_type}")
@@ -451,20 +642,45 @@ class RPDataScraper(RPDataBase):
             logger.error(f"Error selecting search type: {e}")
             return False
 
+    def open_search_url(self, search_type):
+        """
+        Navigate to the deep link for a search type instead of clicking through the dashboard.
+
+        Returns:
+            bool: True once the search bar is ready, False to fall back to the UI flow
+        """
+        try:
+            self.driver.get(self._search_urls[search_type])
+            search_bar, _ = self.wait_for_any_xpath([
+                "//input[contains(@placeholder, 'Search for an address')]",
+                "//input[contains(@id, 'crux-multi-locality-search')]",
+                "//div[@id='crux-search-bar']//input"
+            ], timeout=8)
+            if search_bar:
+                logger.info(f"Opened {search_type} search via deep link")
+                return True
+        except Exception as e:
+            logger.warning(f"Deep link navigation failed for {search_type}: {e}")
+        
+        logger.warning(f"Deep link for {search_type} didn't load, using the dashboard instead")
+        return False
+
     def activate_search_suggestions(self, search_bar):
         try:
             # Try typing a single character to trigger suggestions
             search_bar.send_keys('a')  # or use a very short, generic string
-            # Brief delay for suggestions to load
-            self.random_delay(0.5, 0.8)
+            # Wait for suggestions to load
+            if self.wait_until(DROPDOWN_VISIBLE, timeout=0.8):
+                logger.info("Search suggestions appeared")
+                return
             
             # Alternatively, try simulating keyboard events
             search_bar.send_keys(Keys.DOWN)  # might trigger dropdown
             
             logger.info("Attempted to activate search suggestions")
             
-            # Brief wait for suggestions to appear
-            time.sleep(0.5)
+            # Wait for suggestions to appear
+            self.wait_until(DROPDOWN_VISIBLE, timeout=0.5)
         except Exception as e:
             logger.error(f"Error activating search suggestions: {e}")
 
@@ -482,25 +698,9 @@ class RPDataScraper(RPDataBase):
             if search_type in ["For Sale", "Sales"]:
                 logger.info(f"Search type is {search_type}, using first dropdown option")
                 # Click on the search bar to activate it
-                search_bar_selectors = [
-                    "//input[contains(@placeholder, 'Search for an address')]",
-                    "//input[contains(@id, 'crux-multi-locality-search')]",
-                    "//div[contains(@class, 'search-bar-container')]//input",
-                    "//div[@id='crux-search-bar']//input",
-                    "//input[contains(@placeholder, 'Search')]",
-                    "//input[contains(@type, 'text') and contains(@class, 'MuiInputBase-input')]"
-                ]
-                
-                search_bar = None
-                for selector in search_bar_selectors:
-                    try:
-                        # Moderate timeout
-                        search_bar = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                        if search_bar:
-                            logger.info(f"Found search bar with selector: {selector}")
-                            break
-                    except:
-                        continue
+                search_bar, selector = self.wait_for_any_xpath(SEARCH_FIELD_SELECTORS, timeout=4)
+                if search_bar:
+                    logger.debug("Found search bar with selector: %s", selector)
                 
                 if not search_bar:
                     logger.error("Search bar not found")
@@ -510,34 +710,19 @@ class RPDataScraper(RPDataBase):
                 self.safe_click(search_bar)
                 logger.info("Clicked on search bar")
                 
-                # Brief wait for search bar to activate
-                time.sleep(0.5)
+                # Wait for search bar to take focus
+                self.wait_until(
+                    lambda driver: driver.execute_script("return document.activeElement === arguments[0];", search_bar),
+                    timeout=0.5
+                )
 
-                # Attempt to activate suggestions
+                # Attempt to activate suggestions (waits for the dropdown to appear)
                 self.activate_search_suggestions(search_bar)
                 
-                # Brief delay for dropdown to appear
-                self.random_delay(0.5, 1.0)
-                
                 # Try different selectors for the dropdown option
-                dropdown_selectors = [
-                    "//li[contains(@role, 'option') and @data-option-index='0']",
-                    "//li[contains(@id, 'crux-multi-locality-search-option-0')]", 
-                    "//li[contains(@class, 'MuiAutocomplete-option') and @data-option-index='0']",
-                    "//li[contains(@class, 'MuiAutocomplete-option')]",
-                    "//li[contains(@role, 'option')]"
-                ]
-                
-                first_option = None
-                for selector in dropdown_selectors:
-                    try:
-                        # Moderate timeout
-                        first_option = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                        if first_option:
-                            logger.info(f"Found dropdown option with selector: {selector}")
-                            break
-                    except:
-                        continue
+                first_option, selector = self.wait_for_any_xpath(DROPDOWN_OPTION_SELECTORS, timeout=4)
+                if first_option:
+                    logger.debug("Found dropdown option with selector: %s", selector)
                 
                 if not first_option:
                     logger.error("No dropdown options found")
@@ -545,8 +730,8 @@ class RPDataScraper(RPDataBase):
                 
                 self.safe_click(first_option)
                 logger.info("Selected first dropdown option")
-                # Brief delay
-                self.random_delay(0.3, 0.5)
+                # Wait for the dropdown to close
+                self.wait_until(DROPDOWN_CLOSED, timeout=1)
             
             else:
                 # For the first location, we use the initial search field
@@ -559,56 +744,20 @@ class RPDataScraper(RPDataBase):
                 logger.info(f"Adding first location: {first_location}")
                 
                 # Try multiple search field selectors
-                search_field_selectors = [
-                    "//input[contains(@placeholder, 'Search for an address')]",
-                    "//input[contains(@id, 'crux-multi-locality-search')]",
-                    "//div[contains(@class, 'search-bar-container')]//input",
-                    "//div[@id='crux-search-bar']//input",
-                    "//input[contains(@placeholder, 'Search')]",
-                    "//input[contains(@type, 'text') and contains(@class, 'MuiInputBase-input')]"
-                ]
-                
-                search_field = None
-                for selector in search_field_selectors:
-                    try:
-                        # Moderate timeout
-                        search_field = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                        if search_field:
-                            logger.info(f"Found search field with selector: {selector}")
-                            break
-                    except:
-                        continue
+                search_field, selector = self.wait_for_any_xpath(SEARCH_FIELD_SELECTORS, timeout=4)
+                if search_field:
+                    logger.debug("Found search field with selector: %s", selector)
                 
                 if not search_field:
                     logger.error("Search field for first location not found")
                     return False
                 
-                # Enter first location - using moderate typing speed for reliability
-                self.human_like_typing(search_field, first_location, "normal")
+                # Enter first location - the search is behind the login, so no typing pace is needed
+                self.human_like_typing(search_field, first_location, "fast")
                 logger.info(f"Entered first location: {first_location}")
                 
-                # Brief wait for dropdown options
-                self.random_delay(0.5, 1.0)
-                
-                # Try different selectors for the dropdown option
-                dropdown_selectors = [
-                    "//li[contains(@role, 'option') and @data-option-index='0']",
-                    "//li[contains(@id, 'crux-multi-locality-search-option-0')]", 
-                    "//li[contains(@class, 'MuiAutocomplete-option') and @data-option-index='0']",
-                    "//li[contains(@class, 'MuiAutocomplete-option')]",
-                    "//li[contains(@role, 'option')]"
-                ]
-                
-                first_option = None
-                for selector in dropdown_selectors:
-                    try:
-                        # Moderate timeout
-                        first_option = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                        if first_option:
-                            logger.info(f"Found dropdown option with selector: {selector}")
-                            break
-                    except:
-                        continue
+                # Wait for the suggestion for this location to render
+                first_option = self.wait_for_location_option(first_location, timeout=4)
                 
                 if not first_option:
                     logger.error("No dropdown options found for first location")
@@ -616,97 +765,24 @@ class RPDataScraper(RPDataBase):
                 
                 self.safe_click(first_option)
                 logger.info("Selected first location dropdown option")
-                # Brief delay
-                self.random_delay(0.3, 0.5)
+                # Wait for the dropdown to close
+                self.wait_until(DROPDOWN_CLOSED, timeout=1)
                 
                 # For additional locations, the UI is different
                 if len(locations) > 1:
-                    logger.info("Processing additional locations")
-                    
-                    for location in locations[1:]:
-                        logger.info(f"Adding additional location: {location}")
-                        
-                        # Try to find the additional search field
-                        search_again_selectors = [
-                            "//input[contains(@placeholder, 'Search for a suburb')]",
-                            "//div[contains(@class, 'MuiAutocomplete-root')]//input",
-                            "//div[@data-testid='searchbar']//input",
-                            "//input[contains(@aria-label, 'Search')]",
-                            "//input[contains(@type, 'text') and contains(@class, 'MuiInputBase-input')]",
-                            "//input[contains(@placeholder, 'Search')]"
-                        ]
-                        
-                        additional_search = None
-                        for selector in search_again_selectors:
-                            try:
-                                # Moderate timeout
-                                additional_search = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                                if additional_search:
-                                    logger.info(f"Found additional search field with selector: {selector}")
-                                    break
-                            except:
-                                continue
-                        
-                        if not additional_search:
-                            logger.error(f"Could not find search field for additional location: {location}")
-                            # We've added at least one location, so continue with search
-                            break
-                        
-                        # Enter additional location - using moderate typing speed
-                        self.human_like_typing(additional_search, location, "normal")
-                        logger.info(f"Entered additional location: {location}")
-                        
-                        # Brief wait for dropdown
-                        self.random_delay(0.5, 1.0)
-                        
-                        # Try to find and click the first option for this location
-                        additional_option = None
-                        for selector in dropdown_selectors:
-                            try:
-                                # Moderate timeout
-                                additional_option = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                                if additional_option:
-                                    logger.info(f"Found dropdown option for additional location with selector: {selector}")
-                                    break
-                            except:
-                                continue
-                        
-                        if not additional_option:
-                            logger.warning(f"Could not find dropdown option for: {location}")
-                            # Try to continue anyway
-                            continue
-                        
-                        self.safe_click(additional_option)
-                        logger.info(f"Selected option for additional location: {location}")
-                        # Brief delay
-                        self.random_delay(0.3, 0.5)
+                    self.search_locations_batch(locations[1:])
                 
             # Find and click the search button
-            search_button_selectors = [
-                "//button[contains(@class, 'search-btn')]",
-                "//button[contains(@class, 'button-primary')]//img[contains(@alt, 'Search Button')]/..",
-                "//button[contains(@type, 'button') and contains(@class, 'search-btn')]",
-                "//button[contains(@class, 'MuiButton-contained')]",
-                "//button[contains(@class, 'MuiButtonBase-root')]"
-            ]
-            
-            search_button = None
-            for selector in search_button_selectors:
-                try:
-                    # Moderate timeout
-                    search_button = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                    if search_button:
-                        logger.info(f"Found search button with selector: {selector}")
-                        break
-                except:
-                    continue
+            search_button, selector = self.wait_for_any_xpath(SEARCH_BUTTON_SELECTORS, timeout=8)
+            if search_button:
+                logger.debug("Found search button with selector: %s", selector)
             
             if not search_button:
                 # Try to find by parent container and then button
                 try:
                     container = self.wait_and_find_element(
-                        By.XPATH, 
-                        "//div[contains(@class, 'search-bar-container')]", 
+                        By.CSS_SELECTOR, 
+                        "div[class*='search-bar-container']", 
                         timeout=4
                     )
                     if container:
@@ -718,9 +794,9 @@ class RPDataScraper(RPDataBase):
                                     search_button = button
                                     logger.info("Found search button through container and image")
                                     break
-                            except:
+                            except WebDriverException:
                                 continue
-                except:
+                except WebDriverException:
                     pass
             
             if not search_button:
@@ -731,31 +807,90 @@ class RPDataScraper(RPDataBase):
             self.safe_click(search_button)
             logger.info("Clicked search button")
             
-            # Wait for results page to load
-            self.random_delay(2.0, 3.0)
-            
-            # Check if search results loaded - reasonable timeout
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    lambda driver: "Results for" in driver.page_source or 
-                                  "Displaying" in driver.page_source
-                )
+            # Wait for the results page to load - continues as soon as the results header renders
+            if self.wait_until(EC.presence_of_element_located(
+                    (By.XPATH, "//*[contains(text(), 'Results for') or contains(text(), 'Displaying')]")), timeout=8):
                 logger.info("Search results loaded successfully")
                 return True
-            except:
-                logger.warning("Could not verify search results page - continuing anyway")
-                # Brief wait just in case
-                time.sleep(1)
-                return True  # Still return True to proceed with filtering
+            logger.warning("Could not verify search results page - continuing anyway")
+            return True  # Still return True to proceed with filtering
             
         except Exception as e:
             logger.error(f"Error searching locations: {e}")
             return False
 
 
+    def search_locations_batch(self, locations):
+        """
+        Add further locations to a search that already has its first location.
+
+        The additional search field is located once and reused, each value is
+        set with a single JavaScript call, and the suggestion is picked up by a
+        DOM observer as soon as it renders rather than by polling each selector.
+
+        Returns:
+            int: Number of locations added
+        """
+        logger.info(f"Adding {len(locations)} additional locations")
+        
+        # Try to find the additional search field
+        added = 0
+        field_selector = None
+        for location in locations:
+            logger.info(f"Adding additional location: {location}")
+            
+            # Re-find the field each time since React may re-render it, but only by the selector that worked
+            additional_search, field_selector = self.wait_for_any_xpath(
+                [field_selector] if field_selector else SEARCH_AGAIN_SELECTORS, timeout=8
+            )
+            if not additional_search:
+                logger.error(f"Could not find search field for additional location: {location}")
+                # We've added at least one location, so continue with search
+                break
+            
+            self.human_like_typing(additional_search, location, "fast")
+            logger.info(f"Entered additional location: {location}")
+            
+            # Pick the suggestion for this location as soon as it renders
+            additional_option = self.wait_for_location_option(location)
+            if not additional_option:
+                logger.warning(f"Could not find dropdown option for: {location}")
+                # Try to continue anyway
+                continue
+            
+            self.safe_click(additional_option)
+            added += 1
+            logger.info(f"Selected option for additional location: {location}")
+            # Wait for the dropdown to close before typing the next location
+            self.wait_until(DROPDOWN_CLOSED, timeout=1)
+        
+        return added
+
+    def wait_for_location_option(self, location, timeout=8):
+        """
+        Wait for the suggestion matching location and return it.
+
+        Waiting for an option that contains the typed text returns the moment
+        the right suggestion renders, rather than whatever option happens to be
+        first while the list is still updating. If nothing matches (RP Data can
+        suggest a differently worded locality) the first option is used.
+
+        Returns:
+            The option element, or None if no suggestions appeared
+        """
+        option, _ = self.wait_for_any_xpath([location_option_xpath(location)], timeout=min(3, timeout))
+        if option:
+            return option
+        logger.info(f"No suggestion matching {location}, using the first option")
+        option, selector = self.wait_for_any_xpath(DROPDOWN_OPTION_SELECTORS, timeout=timeout)
+        if option:
+            logger.debug("Found dropdown option with selector: %s", selector)
+        return option
+
     def apply_filters(self, property_types, min_floor_area, max_floor_area, progress_callback=None, milestones=None, search_type=None):
         """
         Apply filters for property types and floor area.
+        Floor areas are ints from coerce_floor_area(), with FloorArea.MIN/MAX meaning no bound.
         Returns:
             - FILTER_NO_RESULTS if no matching properties found
             - FILTER_SUCCESS if filters applied successfully
@@ -771,27 +906,10 @@ class RPDataScraper(RPDataBase):
                 logger.info("Cancellation detected during login navigation")
                 return False
             
-            # Brief wait for the results page to load
-            time.sleep(0.5)
-            
-            # Click the filter button
-            filter_button_selectors = [
-                "//button[contains(@data-testid, 'filter-modal')]",
-                "//button[contains(text(), 'Filters')]",
-                "//button[contains(@class, 'crux-search-filters__container__row__actions__button--filters')]",
-                "//button[contains(@class, 'MuiButton-contained')][contains(text(), 'Filter')]"
-            ]
-            
-            filter_button = None
-            for selector in filter_button_selectors:
-                try:
-                    # Moderate timeout
-                    filter_button = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                    if filter_button:
-                        logger.info(f"Found filter button with selector: {selector}")
-                        break
-                except:
-                    continue
+            # Click the filter button - the wait below covers the results page still loading
+            filter_button, selector = self.wait_for_any_xpath(FILTER_BUTTON_SELECTORS, timeout=8)
+            if filter_button:
+                logger.debug("Found filter button with selector: %s", selector)
             
             if not filter_button:
                 logger.error("Filter button not found")
@@ -799,79 +917,36 @@ class RPDataScraper(RPDataBase):
             
             self.safe_click(filter_button)
             logger.info("Clicked filter button")
-            # Brief delay for filter modal to open
-            self.random_delay(0.3, 0.5)
+            # No separate wait for the modal - the section lookups below wait in-page for it to render
             
             # Set floor area if provided - FASTER IMPLEMENTATION
-            if min_floor_area != "Min" or max_floor_area != "Max":
+            if min_floor_area != FloorArea.MIN or max_floor_area != FloorArea.MAX:
                 logger.info("Setting floor area filters")
                 
-                # Try to find the Floor Area section using the new selectors from the image
-                floor_area_selectors = [
-                    "//h6[contains(text(), 'Floor Area')]",
-                    "//div[contains(text(), 'Floor Area')]",
-                    "//label[contains(text(), 'Floor Area')]"
-                ]
-                
-                floor_area_section = None
-                for selector in floor_area_selectors:
-                    try:
-                        # Moderate timeout
-                        floor_area_section = self.wait_and_find_element(By.XPATH, selector, timeout=3)
-                        if floor_area_section:
-                            logger.info(f"Found Floor Area section with selector: {selector}")
-                            
-                            # Scroll to the floor area section
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", floor_area_section)
-                            # Minimal delay
-                            time.sleep(0.1)
-                            break
-                    except:
-                        continue
-                
+                floor_area_section, selector = self.wait_for_any_xpath(FLOOR_AREA_SELECTORS, timeout=3)
                 if floor_area_section:
+                    logger.debug("Found Floor Area section with selector: %s", selector)
                     # MUCH FASTER APPROACH: Get the input fields directly after finding the section
                     try:
-                        # Get the parent container of the floor area section
-                        parent_element = self.driver.execute_script("""
-                            var el = arguments[0];
-                            while (el && !el.querySelector('input[role="combobox"]')) {
-                                el = el.parentElement;
-                            }
-                            return el;
-                        """, floor_area_section)
+                        # Scroll to the section and collect its inputs in one round-trip
+                        input_fields = self.driver.execute_script(FLOOR_AREA_INPUTS_JS, floor_area_section)
                         
-                        if parent_element:
-                            # Now find the input fields within this container
-                            input_fields = parent_element.find_elements(By.XPATH, ".//input[@role='combobox']")
-                            
+                        if input_fields is not None:
                             if len(input_fields) >= 2:
                                 # The first field is Min, the second is Max - FASTER IMPLEMENTATIONS
-                                if min_floor_area != "Min":
-                                    min_input = input_fields[0]
-                                    # First click to activate
-                                    min_input.click()
-                                    # Minimal delay
-                                    time.sleep(0.1)
-                                    # Clear it and type the value in one go
-                                    min_input.clear()
-                                    min_input.send_keys(min_floor_area + Keys.ENTER)
+                                if min_floor_area != FloorArea.MIN:
+                                    # Set the value and commit it with Enter in one script call
+                                    self.driver.execute_script(FILL_COMBOBOX_JS, input_fields[0], str(int(min_floor_area)))
                                     logger.info(f"Set minimum floor area: {min_floor_area}")
-                                    # Minimal delay
-                                    time.sleep(0.1)
+                                    # Wait for the options list to close before the next field
+                                    self.wait_until(LISTBOX_CLOSED, timeout=1)
                                 
-                                if max_floor_area != "Max":
-                                    max_input = input_fields[1]
-                                    # First click to activate
-                                    max_input.click()
-                                    # Minimal delay
-                                    time.sleep(0.1)
-                                    # Clear it and type the value in one go
-                                    max_input.clear()
-                                    max_input.send_keys(max_floor_area + Keys.ENTER)
+                                if max_floor_area != FloorArea.MAX:
+                                    # Set the value and commit it with Enter in one script call
+                                    self.driver.execute_script(FILL_COMBOBOX_JS, input_fields[1], str(int(max_floor_area)))
                                     logger.info(f"Set maximum floor area: {max_floor_area}")
-                                    # Minimal delay
-                                    time.sleep(0.1)
+                                    # Wait for the options list to close before the next field
+                                    self.wait_until(LISTBOX_CLOSED, timeout=1)
                             else:
                                 logger.warning(f"Expected 2 input fields, found {len(input_fields)}")
                     except Exception as e:
@@ -882,81 +957,25 @@ class RPDataScraper(RPDataBase):
             progress_callback(milestones['filters'], f"Applying filters for {search_type}...")
             
             # FASTER PROPERTY TYPE SELECTION: Use faster methods for checkboxes
-            property_section_selectors = [
-                "//h6[contains(@class, 'MuiTypography-subtitle2')]/span[text()='Property Type']/..",
-                "//div[contains(@class, 'list-box--property-type')]//h6",
-                "//div[contains(@class, 'list-box--property-type')]",
-                "//h6[contains(text(), 'Property Type')]/.."
-            ]
-            
-            property_section = None
-            for selector in property_section_selectors:
-                try:
-                    # Moderate timeout
-                    property_section = self.wait_and_find_element(By.XPATH, selector, timeout=3)
-                    if property_section:
-                        logger.info(f"Found Property Type section with selector: {selector}")
-                        # Scroll to property type section
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", property_section)
-                        # Minimal delay
-                        time.sleep(0.1)
-                        break
-                except:
-                    continue
-            
+            property_section, selector = self.wait_for_any_xpath(PROPERTY_SECTION_SELECTORS, timeout=3)
             if property_section:
-                # FASTER APPROACH: Find all checkboxes in one go and process them
+                logger.debug("Found Property Type section with selector: %s", selector)
+                # FASTER APPROACH: read every checkbox and toggle the ones that differ in one script call
                 try:
-                    # Find the property types and checkboxes
-                    property_container = self.driver.find_element(
-                        By.XPATH, 
-                        "//div[contains(@class, 'list-box--property-type')]"
-                    )
-                    
-                    # Find all checkboxes and their labels in one go
-                    checkbox_elements = property_container.find_elements(
-                        By.XPATH,
-                        ".//input[@type='checkbox']"
-                    )
-                    
-                    label_elements = property_container.find_elements(
-                        By.XPATH,
-                        ".//span[contains(@class, 'MuiFormControlLabel-label')]"
-                    )
-                    
-                    # Create a map of property type labels to checkboxes
-                    property_checkboxes = []
-                    for i, label in enumerate(label_elements):
-                        if i < len(checkbox_elements):
-                            try:
-                                prop_text = label.text.strip()
-                                if prop_text and len(prop_text) > 0:
-                                    property_checkboxes.append((prop_text, checkbox_elements[i]))
-                            except:
-                                pass
+                    property_checkboxes = self.driver.execute_script(
+                        SET_PROPERTY_TYPES_JS, property_section, list(property_types or []))
+                    if property_checkboxes is None:
+                        logger.error("Property type list not found")
+                        property_checkboxes = []
                     
                     logger.info(f"Found {len(property_checkboxes)} property checkboxes")
                     
-                    # Process all checkboxes very quickly
-                    for prop_text, checkbox in property_checkboxes:
-                        try:
-                            is_selected = checkbox.is_selected()
-                            should_be_selected = prop_text in property_types
-                            
-                            if is_selected and not should_be_selected:
-                                # Need to uncheck this property type
-                                logger.info(f"Unchecking property type: {prop_text}")
-                                checkbox.click()  # Direct click is faster
-                                # No delay needed
-                            elif not is_selected and should_be_selected:
-                                # Need to check this property type
-                                logger.info(f"Checking property type: {prop_text}")
-                                checkbox.click()  # Direct click is faster
-                                # No delay needed
-                            else:
-                                logger.info(f"Property type {prop_text} already {'selected' if is_selected else 'unselected'} as needed")
-                        except Exception as e:
-                            logger.warning(f"Error handling property checkbox for {prop_text}: {e}")
+                    for prop_text, was_selected, toggled in property_checkboxes:
+                        if toggled:
+                            logger.debug("%s property type: %s", "Unchecked" if was_selected else "Checked", prop_text)
+                        else:
+                            logger.debug("Property type %s already %s as needed", prop_text,
+                                         "selected" if was_selected else "unselected")
                 except Exception as e:
                     logger.error(f"Error handling property types: {e}")
             else:
@@ -965,55 +984,31 @@ class RPDataScraper(RPDataBase):
 
             progress_callback(milestones['filters'], f"Applying filters for {search_type}...")
 
+
             
-            # Minimal delay before applying filters
-            time.sleep(0.2)
-            
-            apply_button_selectors = [
-                "//button[@data-testid='apply-filters']",
-                "//button[contains(text(), 'Show')]",
-                "//button[contains(@class, 'MuiButton-containedPrimary')]",
-                "//button[contains(@class, 'MuiButton-disableElevation')]",
-                "//button[contains(text(), 'Apply')]",
-                "//button[contains(text(), 'Filter')]"
-            ]
-            
-            apply_button = None
-            for selector in apply_button_selectors:
-                try:
-                    # Moderate timeout
-                    apply_button = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                    if apply_button:
-                        logger.info(f"Found apply button with selector: {selector}")
-                        break
-                except:
-                    continue
+            apply_button, selector = self.wait_for_any_xpath(APPLY_BUTTON_SELECTORS, timeout=4)
+            if apply_button:
+                logger.debug("Found apply button with selector: %s", selector)
             
             if apply_button:
                 # Check if the button contains "No matching properties found" text
                 no_results_found = False
                 
-                # First, check if there's a div with the "No matching properties found" text
+                # The button's rendered text includes its visible child divs, so one read covers
+                # both the nested message and plain button text without a miss-expected lookup
                 try:
-                    no_results_div = apply_button.find_element(By.XPATH, ".//div[contains(text(), 'No matching properties found')]")
-                    if no_results_div and no_results_div.is_displayed():
-                        logger.info("Filter button indicates no matching properties found")
+                    button_text = apply_button.text
+                    if "No matching properties found" in button_text:
+                        logger.info(f"Filter button text indicates no results: {button_text}")
                         no_results_found = True
-                except:
-                    # Also check the button text directly
-                    try:
-                        button_text = apply_button.text
-                        if "No matching properties found" in button_text:
-                            logger.info(f"Filter button text indicates no results: {button_text}")
-                            no_results_found = True
-                    except:
-                        pass
+                except WebDriverException:
+                    pass
                 
                 # Always click the button to apply filters or return to search page
                 self.safe_click(apply_button)
                 logger.info("Clicked apply button")
-                # Brief wait after applying filters
-                self.random_delay(0.5, 1.0)
+                # Wait for the filter modal to close
+                self.wait_until(EC.staleness_of(apply_button), timeout=2)
                 
                 # If we found no results, we need to explicitly navigate back to the dashboard
                 if no_results_found:
@@ -1043,38 +1038,25 @@ class RPDataScraper(RPDataBase):
         logger.info("Attempting to click CoreLogic logo to return to dashboard")
         
         try:
-            # First, try the exact logo selector from the HTML
-            logo_selectors = [
-                "//div[@class='logo']/a[@class='cl-logo']",
-                "//a[@class='cl-logo']",
-                "//img[@class='cl-logo-img' and @alt='CoreLogic']/..",
-                "//img[@alt='CoreLogic']/.."
-            ]
-            
-            logo = None
-            for selector in logo_selectors:
-                try:
-                    # Moderate timeout
-                    logo = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                    if logo:
-                        logger.info(f"Found CoreLogic logo with selector: {selector}")
-                        break
-                except:
-                    continue
+            # Nothing to do if a failed step never left the dashboard - checked in the same
+            # probe as the logo lookup, ahead of the exact logo selector from the HTML
+            logo, selector = self.wait_for_any_xpath([DASHBOARD_XPATH, *CORELOGIC_LOGO_SELECTORS], timeout=4)
+            if selector == DASHBOARD_XPATH:
+                self._logged_in = True
+                logger.info("Already on dashboard, no need to click the logo")
+                return True
+            if logo:
+                logger.debug("Found CoreLogic logo with selector: %s", selector)
             
             if logo:
                 self.safe_click(logo)
                 logger.info("Clicked CoreLogic logo to return to dashboard")
                 
                 # Wait for dashboard to load - reasonable timeout
-                try:
-                    WebDriverWait(self.driver, 8).until(
-                        lambda driver: "Start your search here" in driver.page_source
-                    )
+                if self.wait_for_dashboard(timeout=8):
                     logger.info("Successfully returned to dashboard after clicking logo")
                     return True
-                except:
-                    logger.warning("Could not verify dashboard page after clicking logo")
+                logger.warning("Could not verify dashboard page after clicking logo")
             else:
                 logger.warning("Could not find CoreLogic logo to click")
             
@@ -1096,67 +1078,31 @@ class RPDataScraper(RPDataBase):
                 logger.info("Cancellation detected during login navigation")
                 return False
             
-            # Brief wait for results page to load
-            time.sleep(0.5)
+            # Wait for the results page's select-all control (or the no-results message) to load
+            self.wait_until(EC.presence_of_element_located((
+                By.XPATH,
+                "//div[@data-testid='rapid-multi-select-counter'] | //*[contains(text(), 'No matching properties found')]"
+            )), timeout=3)
             
-            # First, check if there are genuinely NO results
+            # First, check if there are genuinely NO results - every indicator in one call
             try:
                 # Look ONLY for definitive indicators of no results
-                no_results = False
-                
-                # Check for explicit "No matching properties found" message
-                try:
-                    no_matches = self.driver.find_element(
-                        By.XPATH, 
-                        "//div[contains(text(), 'No matching properties found')]"
-                    )
-                    if no_matches and no_matches.is_displayed():
+                probe = self.run_js(NO_RESULTS_PROBE_JS, NO_RESULTS_XPATH)
+                if probe:
+                    kind, text = probe
+                    if kind == "no-matches":
                         logger.info("No matching properties found - returning to home page")
                         return False
-                except:
-                    pass
-                    
-                # Check for explicit zero results indicators
-                no_results_indicators = [
-                    "//div[text()='No results found']",
-                    "//div[text()='No properties found']",
-                    "//div[contains(text(), '0 properties') and not(contains(text(), 'of'))]",
-                    "//div[contains(text(), '0 result') and not(contains(text(), 'of'))]"
-                ]
-                
-                for indicator in no_results_indicators:
-                    try:
-                        element = self.driver.find_element(By.XPATH, indicator)
-                        if element and element.is_displayed():
-                            logger.info(f"No search results found: {element.text}")
-                            no_results = True
-                            break
-                    except:
-                        continue
-                
-                # Check if results count explicitly shows zero (but avoid false positives)
-                if not no_results:
-                    try:
-                        results_element = self.driver.find_element(
-                            By.XPATH, 
-                            "//div[contains(@class, 'result-count-main')]"
-                        )
-                        results_text = results_element.text
-                        
-                        # Only consider it "no results" if it explicitly has "0 " at the start 
-                        # (to avoid matching "10 of 10" or similar)
-                        if results_text.strip().startswith("0 ") or "Displaying 0" in results_text:
-                            logger.info(f"Zero results indicated in count: {results_text}")
-                            no_results = True
-                        else:
-                            # Log what was found - this helps with debugging
-                            logger.info(f"Results found: {results_text}")
-                    except:
-                        pass
-                
-                # If we've determined there are no results, return False
-                if no_results:
-                    return False
+                    if kind == "indicator":
+                        logger.info(f"No search results found: {text}")
+                        return False
+                    # Only consider it "no results" if the count explicitly has "0 " at the start
+                    # (to avoid matching "10 of 10" or similar)
+                    if text.strip().startswith("0 ") or "Displaying 0" in text:
+                        logger.info(f"Zero results indicated in count: {text}")
+                        return False
+                    # Log what was found - this helps with debugging
+                    logger.info(f"Results found: {text}")
                 
             except Exception as e:
                 logger.warning(f"Error during no-results check: {e}")
@@ -1164,126 +1110,33 @@ class RPDataScraper(RPDataBase):
             
             # We've reached here, so we assume there ARE results - try to select them
             
-            # MULTI-STRATEGY APPROACH: Try several methods to find and click the checkbox
-            checkbox_clicked = False
-            
-            # Strategy 1: Find the checkbox input directly by its class
-            if not checkbox_clicked:
-                try:
-                    checkbox_input = self.driver.find_element(
-                        By.XPATH,
-                        "//input[@class='PrivateSwitchBase-input css-1m9pwf3']"
-                    )
-                    logger.info("Found checkbox input directly by class")
-                    checkbox_input.click()
-                    logger.info("Clicked checkbox input directly")
-                    checkbox_clicked = True
-                    # Brief wait for dropdown to appear
-                    time.sleep(0.5)
-                except Exception as e:
-                    logger.warning(f"Direct checkbox input click failed: {e}")
-            
-            # Strategy 2: Find through the parent span with data-testid
-            if not checkbox_clicked:
-                try:
-                    checkbox_span = self.driver.find_element(
-                        By.XPATH,
-                        "//span[@data-testid='multi-select-check-icon']"
-                    )
-                    logger.info("Found checkbox span by data-testid")
-                    checkbox_input = checkbox_span.find_element(By.XPATH, ".//input[@type='checkbox']")
-                    logger.info("Found checkbox input within span")
-                    checkbox_input.click()
-                    logger.info("Clicked checkbox input within span")
-                    checkbox_clicked = True
-                    # Brief wait for dropdown to appear
-                    time.sleep(0.5)
-                except Exception as e:
-                    logger.warning(f"Checkbox within span click failed: {e}")
-            
-            # Strategy 3: Find through the container div
-            if not checkbox_clicked:
-                try:
-                    container = self.driver.find_element(
-                        By.XPATH,
-                        "//div[@data-testid='rapid-multi-select-counter']"
-                    )
-                    logger.info("Found multi-select counter container")
-                    checkbox_input = container.find_element(By.XPATH, ".//input[@type='checkbox']")
-                    logger.info("Found checkbox input within container")
-                    checkbox_input.click()
-                    logger.info("Clicked checkbox input within container")
-                    checkbox_clicked = True
-                    # Brief wait for dropdown to appear
-                    time.sleep(0.5)
-                except Exception as e:
-                    logger.warning(f"Checkbox within container click failed: {e}")
-            
-            # Strategy 4: JavaScript approach on span
-            if not checkbox_clicked:
-                try:
-                    checkbox_span = self.driver.find_element(
-                        By.XPATH,
-                        "//span[@data-testid='multi-select-check-icon']"
-                    )
-                    logger.info("Found checkbox span for JavaScript approach")
-                    self.driver.execute_script("arguments[0].click();", checkbox_span)
-                    logger.info("Clicked checkbox span with JavaScript")
-                    checkbox_clicked = True
-                    # Brief wait for dropdown to appear
-                    time.sleep(0.5)
-                except Exception as e:
-                    logger.error(f"All checkbox click strategies failed: {e}")
-                    return False  # Only return False here if we couldn't click ANY checkbox
+            # MULTI-STRATEGY APPROACH: the candidates are checked in order within one wait,
+            # so a results table that is still rendering doesn't fail every strategy at once
+            checkbox, selector = self.wait_for_any_xpath(SELECT_ALL_CHECKBOX_SELECTORS, timeout=3)
+            if checkbox is None:
+                logger.error("All checkbox click strategies failed: select-all checkbox not found")
+                return False  # Only return False here if we couldn't find ANY checkbox
+            logger.debug("Found select-all checkbox with selector: %s", selector)
+            checkbox_clicked = self.safe_click(checkbox)
+            if checkbox_clicked:
+                logger.info("Clicked select-all checkbox")
             
             # Only proceed to dropdown selection if we successfully clicked a checkbox
             if checkbox_clicked:
                 try:
-                    # Try to find all options in the dropdown
-                    option_labels = self.driver.find_elements(
-                        By.XPATH,
-                        "//span[@data-testid='single-select-checkbox-label']"
-                    )
+                    # Wait for the dropdown options to appear
+                    self.wait_until(EC.presence_of_element_located((
+                        By.CSS_SELECTOR,
+                        "span[data-testid='single-select-checkbox-label'], input#all-option"
+                    )), timeout=2)
                     
-                    if len(option_labels) >= 3:
-                        # Get the middle label (index 1) - usually "Select All"
-                        middle_label = option_labels[1]
-                        middle_text = middle_label.text
-                        logger.info(f"Found middle option label: {middle_text}")
-                        
-                        # Click the middle option label
-                        middle_label.click()
-                        logger.info(f"Clicked middle option: {middle_text}")
-                        # Brief delay after selection
-                        time.sleep(0.5)
+                    # Click the middle option ("Select All") by label, radio input or id in one call
+                    clicked = self.run_js(CLICK_SELECT_ALL_OPTION_JS)
+                    if clicked:
+                        logger.info(f"Clicked middle option: {clicked}")
                         return True
-                    else:
-                        # Try to directly find the inputs
-                        radio_inputs = self.driver.find_elements(
-                            By.XPATH,
-                            "//input[@data-testid='single-select-checkbox']"
-                        )
-                        
-                        if len(radio_inputs) >= 3:
-                            # Click the middle radio option (index 1)
-                            middle_radio = radio_inputs[1]
-                            middle_radio.click()
-                            logger.info("Clicked middle radio input")
-                            # Brief delay after selection
-                            time.sleep(0.5)
-                            return True
-                        else:
-                            # Last resort: try to find by id
-                            all_option = self.driver.find_element(
-                                By.XPATH,
-                                "//input[@id='all-option']"
-                            )
-                            
-                            all_option.click()
-                            logger.info("Clicked 'all-option' by ID")
-                            # Brief delay after selection
-                            time.sleep(0.5)
-                            return True
+                    logger.error("Failed to click dropdown option: no select-all option found")
+                    return False
                 except Exception as e:
                     logger.error(f"Failed to click dropdown option: {e}")
                     return False
@@ -1300,32 +1153,27 @@ class RPDataScraper(RPDataBase):
         logger.info("===== EXPORTING RESULTS TO CSV =====")
         
         try:
-            # Brief wait for results page after selection
-            time.sleep(0.5)
+            prefix = PREFIX_MAP.get(search_type)
+            if not prefix:
+                logger.error(f"Unknown search type for file prefix: {search_type}")
+                return False
             
-            # Check if the export button exists - if not, likely no results to export
+            # Wait for the export button to become clickable - if it doesn't, likely no results to export
             # This is a fallback check in case select_all_results() didn't catch it
-            try:
-                export_exists = self.driver.find_element(
-                    By.XPATH,
-                    "//button[@data-testid='export-to-csv-button']"
+            state = {}
+            def export_ready(driver):
+                state.update(driver.execute_script(EXPORT_BUTTON_STATE_JS))
+                return state['visible'] and state['enabled']
+            if not self.wait_until(export_ready, timeout=3):
+                logger.info(
+                    "Export button %s - likely no results to export",
+                    "disabled or hidden" if state.get('present') else "not found"
                 )
-                if not export_exists.is_displayed() or not export_exists.is_enabled():
-                    logger.info("Export button not visible or enabled - likely no results to export")
-                    return False
-            except:
-                logger.info("Export button not found - likely no results to export")
                 return False
-                
-            # Brief wait before clicking export
-            time.sleep(0.3)
             
-            # Try to find the export button directly by data-testid
+            # Click the button the readiness check returned
             try:
-                export_button = self.driver.find_element(
-                    By.XPATH,
-                    "//button[@data-testid='export-to-csv-button']"
-                )
+                export_button = state['button']
                 logger.info("Found export button by data-testid")
                 
                 # Click using regular click method
@@ -1338,8 +1186,8 @@ class RPDataScraper(RPDataBase):
                 try:
                     # Find by class
                     export_button = self.driver.find_element(
-                        By.XPATH,
-                        "//button[contains(@class, 'button-export-to-csv')]"
+                        By.CSS_SELECTOR,
+                        "button[class*='button-export-to-csv']"
                     )
                     logger.info("Found export button by class")
                     
@@ -1364,65 +1212,33 @@ class RPDataScraper(RPDataBase):
                         logger.error(f"Could not find export button: {e}")
                         return False
             
-            # Wait for dialog to appear
-            self.random_delay(0.5, 1.0)
+            # Wait for the export dialog to render its disclaimer checkbox
+            self.wait_and_find_element(
+                By.CSS_SELECTOR,
+                "input[data-testid='export-disclaimer-checkbox']",
+                timeout=5
+            )
             
-            # FASTER CHECKBOX HANDLING: Use JavaScript to check all at once
+            # FASTER CHECKBOX HANDLING: tick every visible checkbox and the acknowledgement
+            # box in one JavaScript call
             try:
-                # Use JavaScript to check all checkboxes at once
-                self.driver.execute_script("""
-                    var checkboxes = document.querySelectorAll('input[type="checkbox"]:not(:checked)');
-                    for(var i=0; i<checkboxes.length; i++) {
-                        if(checkboxes[i].offsetParent !== null) {  // Only check visible checkboxes
-                            checkboxes[i].click();
-                        }
-                    }
-                """)
-                logger.info("Checked all visible checkboxes in export dialog using JavaScript")
+                acknowledged = self.run_js(CHECK_EXPORT_DIALOG_JS)
             except Exception as e:
-                logger.warning(f"JavaScript checkbox checking failed: {e}")
-                # Fallback to individual checks if needed
-                try:
-                    checkboxes = self.driver.find_elements(By.XPATH, "//input[@type='checkbox']")
-                    logger.info(f"Found {len(checkboxes)} checkboxes in export dialog")
-                    
-                    for checkbox in checkboxes:
-                        if not checkbox.is_selected() and checkbox.is_displayed():
-                            try:
-                                checkbox.click()  # Direct click is faster
-                            except:
-                                pass
-                except:
-                    pass
-            
-            # Check the acknowledgement box
-            logger.info("Attempting to find and click the acknowledgement checkbox...")
-            
-            try:
-                # Find by data-testid
-                ack_checkbox = self.driver.find_element(
-                    By.XPATH,
-                    "//input[@data-testid='export-disclaimer-checkbox']"
-                )
-                logger.info("Found acknowledgement checkbox by data-testid")
-                
-                # Click using JavaScript for reliability
-                self.driver.execute_script("arguments[0].click();", ack_checkbox)
-                logger.info("Clicked acknowledgement checkbox using JavaScript")
-            except Exception as e:
-                logger.error(f"Could not find and click acknowledgement checkbox: {e}")
+                logger.error(f"Could not check the export dialog checkboxes: {e}")
+                return False
+            if not acknowledged:
+                logger.error("Could not find and click acknowledgement checkbox")
                 return False
+            logger.info("Checked all visible checkboxes and the acknowledgement checkbox in export dialog")
             
-            # Brief wait before clicking final export button
-            time.sleep(0.3)
+            # Wait for the final export button to enable once the disclaimer is ticked
+            final_export = self.wait_and_find_clickable(By.CSS_SELECTOR, "button[data-testid='submit-button']", timeout=3)
             
             # Click the final export button - using exact element from the HTML
             try:
-                # Try by exact data-testid first
-                final_export = self.driver.find_element(
-                    By.XPATH,
-                    "//button[@data-testid='submit-button']"
-                )
+                # The wait above already found it by exact data-testid
+                if final_export is None:
+                    raise WebDriverException("submit-button not clickable")
                 logger.info("Found final export button by exact data-testid")
                 
                 # Click the button
@@ -1435,8 +1251,8 @@ class RPDataScraper(RPDataBase):
                 try:
                     # Try by exact class
                     final_export = self.driver.find_element(
-                        By.XPATH,
-                        "//button[contains(@class, 'MuiButton-containedPrimary')]"
+                        By.CSS_SELECTOR,
+                        "button[class*='MuiButton-containedPrimary']"
                     )
                     logger.info("Found final export button by class")
                     
@@ -1461,30 +1277,16 @@ class RPDataScraper(RPDataBase):
                         logger.error(f"All attempts to click final export button failed: {e}")
                         return False
             
-            # Wait for download to complete
-            self.random_delay(3.0, 5.0)  
-            
             # Verify download
-            prefix_map = {
-                "Sales": "recentSaleExport",
-                "For Sale": "forSaleExport",
-                "For Rent": "forRentExport"
-            }
+            logger.info(f"Waiting for downloaded file with prefix: {prefix}")
             
-            prefix = prefix_map.get(search_type)
-            if not prefix:
-                logger.error(f"Unknown search type for file prefix: {search_type}")
-                return False
-            
-            print(f"Looking for downloaded file with prefix: {prefix}")
-            print(f"Download directory: {self.download_dir}")
-            print(f"Files in the download directory: {os.listdir(self.download_dir)}")
+            # Wait for Chrome to finish the download (the .crdownload rename). The watcher
+            # skips files from before it started, so an older export is never mistaken for this one
+            downloaded_file = self.download_watcher.wait_for_file(prefix, timeout=60)
             
-            # Check for downloaded file
-            downloaded_files = [f for f in os.listdir(self.download_dir) if f.startswith(prefix)]
-            
-            if downloaded_files:
-                logger.info(f"Successfully downloaded file: {downloaded_files[0]}")
+            if downloaded_file:
+                self.last_download = downloaded_file
+                logger.info(f"Successfully downloaded file: {os.path.basename(downloaded_file)}")
                 return True
             else:
                 logger.error(f"No downloaded file found with prefix {prefix}")
@@ -1499,86 +1301,52 @@ class RPDataScraper(RPDataBase):
         logger.info("===== RETURNING TO DASHBOARD =====")
         
         try:
-            # First, check if we're already on the dashboard
-            try:
-                dashboard_text = self.driver.find_element(By.XPATH, "//div[contains(text(), 'Start your search here')]")
-                if dashboard_text.is_displayed():
-                    logger.info("Already on dashboard, no need to navigate")
-                    return True
-            except:
-                # Not on dashboard, need to navigate there
-                pass
-                
-            # Try to click the logo to return to dashboard
-            logo_selectors = [
-                "//a[contains(@class, 'cl-logo')]",
-                "//img[contains(@alt, 'CoreLogic')]/..",
-                "//img[contains(@alt, 'CoreLogic')]",
-                "//a[contains(@href, '/dashboard')]",
-                "//a[contains(@class, 'home')]",
-                "//div[@class='logo']/a[@class='cl-logo']"
-            ]
-            
-            logo = None
-            for selector in logo_selectors:
-                try:
-                    # Moderate timeout
-                    logo = self.wait_and_find_clickable(By.XPATH, selector, timeout=4)
-                    if logo:
-                        logger.info(f"Found logo with selector: {selector}")
-                        break
-                except:
-                    continue
+            # Check for the dashboard and locate the logo in the same in-page probe. A list, so
+            # the dashboard prompt is always checked first whichever selector won last time
+            logo, selector = self.wait_for_any_xpath([DASHBOARD_XPATH, *HOME_LINK_SELECTORS], timeout=4)
+            if selector == DASHBOARD_XPATH:
+                self._logged_in = True
+                logger.info("Already on dashboard, no need to navigate")
+                return True
+            if logo:
+                logger.debug("Found logo with selector: %s", selector)
             
             if logo:
                 self.safe_click(logo)
                 logger.info("Clicked logo to return to dashboard")
                 
-                # Brief wait for dashboard to load
-                self.random_delay(1.0, 2.0)
-                
                 # Verify we're back at the dashboard - reasonable timeout
-                try:
-                    WebDriverWait(self.driver, 8).until(
-                        lambda driver: "Start your search here" in driver.page_source
-                    )
+                if self.wait_for_dashboard(timeout=8):
                     logger.info("Successfully returned to dashboard")
                     return True
-                except:
-                    logger.warning("Could not verify dashboard page")
+                logger.warning("Could not verify dashboard page")
             
             # If that didn't work, try direct navigation
             logger.info("Trying direct navigation to dashboard")
             self.driver.get(self.login_url)
-            # Brief wait for page to load
-            self.random_delay(1.0, 2.0)
             
             # Check if we're on the dashboard - reasonable timeout
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    lambda driver: "Start your search here" in driver.page_source
-                )
+            if self.wait_for_dashboard(timeout=8):
                 logger.info("Successfully navigated to dashboard")
                 return True
-            except:
-                logger.warning("Could not verify dashboard page after direct navigation")
-                # Let's try one more approach - go to base URL
-                try:
-                    # Get the base URL 
-                    base_url = self.login_url.split('://')[0] + '://' + self.login_url.split('://')[1].split('/')[0]
-                    self.driver.get(base_url)
-                    logger.info(f"Trying navigation to base URL: {base_url}")
-                    # Brief wait for page to load
-                    self.random_delay(1.0, 2.0)
-                    
-                    # Reasonable timeout
-                    WebDriverWait(self.driver, 8).until(
-                        lambda driver: "Start your search here" in driver.page_source
-                    )
+            logger.warning("Could not verify dashboard page after direct navigation")
+            # Let's try one more approach - go to base URL, unless that's the page we just loaded
+            base_url = self.base_url
+            if base_url == self.login_url.rstrip('/'):
+                logger.warning("All dashboard navigation attempts failed")
+                logger.warning("Could not confirm return to dashboard, but continuing anyway")
+                return True
+            try:
+                self.driver.get(base_url)
+                logger.info(f"Trying navigation to base URL: {base_url}")
+                
+                # Reasonable timeout
+                if self.wait_for_dashboard(timeout=8):
                     logger.info("Successfully navigated to dashboard using base URL")
                     return True
-                except:
-                    logger.warning("All dashboard navigation attempts failed")
+            except Exception as e:
+                logger.warning(f"Error navigating to base URL: {e}")
+            logger.warning("All dashboard navigation attempts failed")
             
             # At this point, just assume we can continue
             logger.warning("Could not confirm return to dashboard, but continuing anyway")